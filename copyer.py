@@ -5,6 +5,7 @@ import logging
 import multiprocessing
 import configparser
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from modules.order_aggregator import OrderAggregator
@@ -29,6 +30,9 @@ logger = logging.getLogger()
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
 
+# Párhuzamos SL ellenőrzések felső korlátja (a Bybit rate limitje alatt marad)
+SL_CHECK_MAX_WORKERS = 4
+
 def enable_windows_ansi():
     """
     Bekapcsolja az ANSI escape kódok támogatását a Windows terminálokban a színes loghoz.
@@ -242,74 +246,92 @@ def main():
         inactive_cycles_counter = 0
         MIN_INACTIVE_CYCLES_FOR_SYNC = 2 
 
+        # A bot processz élő-ellenőrzése (waitpid) csak minden N. ciklusban fut
+        bot_check_counter = 0
+        BOT_CHECK_EVERY_N_CYCLES = 10
+
+        # A ciklusban sokszor használt globális nevek és kötött metódusok lokálisba kötése
+        _log = logger
+        _sleep = time.sleep
+        _get_data = get_data
+        _send_tg = send_telegram_message
+        _check_sl = check_and_set_sl
+        _update_reports = reporting_manager.update_reports
+        _main_event_loop = main_event_loop
+        _get_ready_orders = order_aggregator.get_ready_orders
+
         while True:
             cycle_events = []
             
-            if bot_process and not bot_process.is_alive():
-                logger.warning("A Telegram bot processz váratlanul leállt.")
-                bot_process = None
+            if bot_process:
+                if bot_check_counter % BOT_CHECK_EVERY_N_CYCLES == 0 and not bot_process.is_alive():
+                    _log.warning("A Telegram bot processz váratlanul leállt.")
+                    bot_process = None
+                bot_check_counter += 1
 
-            logger.info("-" * 60)
+            _log.info("-" * 60)
             
-            activity_detected, new_last_id = main_event_loop(config_data, state_manager, order_aggregator)
+            activity_detected, new_last_id = _main_event_loop(config_data, state_manager, order_aggregator)
             
             if activity_detected:
                 inactive_cycles_counter = 0
                 activity_since_last_pnl_update = True
                 aggregation_window = config_data['settings'].get('aggregation_window_seconds', 3)
-                logger.info(f"Új események észlelve, várakozás {aggregation_window + 1} mp-et az aggregációra...")
-                time.sleep(aggregation_window + 1)
+                _log.info(f"Új események észlelve, várakozás {aggregation_window + 1} mp-et az aggregációra...")
+                _sleep(aggregation_window + 1)
             else:
                 inactive_cycles_counter += 1
             
             if new_last_id:
                 last_id_to_commit = new_last_id
             
-            ready_orders = order_aggregator.get_ready_orders()
+            ready_orders = _get_ready_orders()
             if ready_orders:
                 process_aggregated_orders(ready_orders, config_data, state_manager, reporting_manager, cycle_events)
                 activity_since_last_pnl_update = True
                 inactive_cycles_counter = 0
 
             if inactive_cycles_counter >= MIN_INACTIVE_CYCLES_FOR_SYNC:
-                logger.info(f"{inactive_cycles_counter} inaktív ciklus telt el, mély szinkron ellenőrzés futtatása...")
+                _log.info(f"{inactive_cycles_counter} inaktív ciklus telt el, mély szinkron ellenőrzés futtatása...")
                 pending_actions = order_aggregator.peek_pending_actions()
                 if pending_actions:
-                    logger.warning(f"Szinkronizálás futtatása közben függőben lévő akciók: {pending_actions}")
+                    _log.warning(f"Szinkronizálás futtatása közben függőben lévő akciók: {pending_actions}")
                 
                 check_positions_sync(config_data, state_manager, pending_actions=pending_actions)
                 inactive_cycles_counter = 0
             else:
-                logger.info(f"Mély szinkron ellenőrzés kihagyva. Inaktív ciklusok: {inactive_cycles_counter}/{MIN_INACTIVE_CYCLES_FOR_SYNC}.")
+                _log.info(f"Mély szinkron ellenőrzés kihagyva. Inaktív ciklusok: {inactive_cycles_counter}/{MIN_INACTIVE_CYCLES_FOR_SYNC}.")
 
-            reporting_manager.update_reports(pnl_update_needed=activity_since_last_pnl_update)
+            _update_reports(pnl_update_needed=activity_since_last_pnl_update)
             if activity_since_last_pnl_update:
                 activity_since_last_pnl_update = False
 
-            demo_positions_response = get_data(config_data['demo_api'], "/v5/position/list", {'category': 'linear', 'settleCoin': 'USDT'})
+            demo_positions_response = _get_data(config_data['demo_api'], "/v5/position/list", {'category': 'linear', 'settleCoin': 'USDT'})
             if demo_positions_response and demo_positions_response.get('list'):
-                for pos in demo_positions_response['list']:
-                    if float(pos.get('size', '0')) > 0:
-                        sl_event = check_and_set_sl(pos, config_data)
-                        if sl_event:
-                            cycle_events.append({'type': 'sl', 'data': sl_event})
-                        time.sleep(0.3)
+                open_positions = [pos for pos in demo_positions_response['list'] if float(pos.get('size', '0')) > 0]
+                if open_positions:
+                    with ThreadPoolExecutor(max_workers=SL_CHECK_MAX_WORKERS) as sl_executor:
+                        futures = [sl_executor.submit(_check_sl, pos, config_data) for pos in open_positions]
+                        for future in as_completed(futures):
+                            sl_event = future.result()
+                            if sl_event:
+                                cycle_events.append({'type': 'sl', 'data': sl_event})
             
             if cycle_events:
                 summary_message = format_cycle_summary(cycle_events, __version__)
                 if summary_message:
-                    send_telegram_message(config_data, summary_message)
+                    _send_tg(config_data, summary_message)
 
             if last_id_to_commit:
-                logger.info(f"Ciklus sikeres, új last_processed_exec_id mentése: {last_id_to_commit}")
+                _log.info(f"Ciklus sikeres, új last_processed_exec_id mentése: {last_id_to_commit}")
                 state_manager.set_last_id(last_id_to_commit)
                 last_id_to_commit = None
 
             interval = config_data['settings']['loop_interval']
             
-            logger.info(f"--- Ciklus vége, várakozás {interval} másodpercet... (aktív várakozás) ---")
+            _log.info(f"--- Ciklus vége, várakozás {interval} másodpercet... (aktív várakozás) ---")
             for _ in range(interval):
-                time.sleep(1)
+                _sleep(1)
             
     except KeyboardInterrupt:
         logger.info("Program leállítva (Ctrl+C).")
@@ -8,9 +8,7 @@ import sys
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
-import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
-import time
+from multiprocessing import freeze_support
 
 from modules.logger import setup_logging, get_logger
 from modules.file_utils import ensure_directory_structure, load_account_configs
@@ -21,13 +19,16 @@ from modules.security import SecurityManager
 from modules.exceptions import CopytraderError, ConfigurationError
 from telegram_bot.telegram_bot import TelegramBot
 
-# Global shutdown event
-shutdown_event = multiprocessing.Event()
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 class CopytraderApplication:
     """Main application orchestrator"""
     
-    def __init__(self):
+    def __init__(self, shutdown_event: asyncio.Event):
         self.logger = None
         self.accounts = {}
         self.sync_managers = {}
@@ -35,6 +36,11 @@ class CopytraderApplication:
         self.reporting_manager = None
         self.running = False
         
+        # Main loop period (seconds) and the event that cuts its wait short
+        self.cycle_period = 10.0
+        self.error_backoff = 30.0
+        self.shutdown_event = shutdown_event
+        
     async def initialize(self):
         """Initialize the application"""
         try:
@@ -118,31 +124,28 @@ class CopytraderApplication:
             if self.telegram_bot:
                 asyncio.create_task(self.telegram_bot.start())
             
+            loop = asyncio.get_running_loop()
+            
             # Main sync loop
-            while self.running and not shutdown_event.is_set():
+            while self.running and not self.shutdown_event.is_set():
+                cycle_start = loop.time()
                 try:
-                    # Run sync cycles for all pairs
-                    for sync_key, sync_manager in self.sync_managers.items():
-                        if shutdown_event.is_set():
-                            break
-                            
-                        try:
-                            await sync_manager.run_sync_cycle()
-                        except Exception as e:
-                            self.logger.error(f"Sync error for {sync_key}: {e}")
-                    
-                    # Update reports
-                    try:
-                        await self.reporting_manager.update_all_reports()
-                    except Exception as e:
-                        self.logger.error(f"Reporting error: {e}")
+                    # Run sync cycles for all pairs and the report update concurrently
+                    await asyncio.gather(
+                        *(self._run_sync_pair(sync_key, sync_manager)
+                          for sync_key, sync_manager in self.sync_managers.items()),
+                        self._run_reporting()
+                    )
                     
-                    # Sleep before next cycle
-                    await asyncio.sleep(10)  # 10 second cycle
+                    # Wait out the rest of the cycle period, or until shutdown
+                    remaining = max(0.0, self.cycle_period - (loop.time() - cycle_start))
+                    if await self._wait_for_shutdown(remaining):
+                        break
                     
                 except Exception as e:
                     self.logger.error(f"Error in main loop: {e}", exc_info=True)
-                    await asyncio.sleep(30)  # Longer wait on error
+                    if await self._wait_for_shutdown(self.error_backoff):  # Longer wait on error
+                        break
                     
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
@@ -151,11 +154,33 @@ class CopytraderApplication:
         finally:
             await self.shutdown()
     
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        """Wait up to timeout seconds; return True as soon as shutdown is requested"""
+        try:
+            await asyncio.wait_for(self.shutdown_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.shutdown_event.is_set()
+    
+    async def _run_sync_pair(self, sync_key: str, sync_manager: SyncManager):
+        """Run one sync cycle for a pair, logging instead of propagating errors"""
+        try:
+            await sync_manager.run_sync_cycle()
+        except Exception as e:
+            self.logger.error(f"Sync error for {sync_key}: {e}")
+    
+    async def _run_reporting(self):
+        """Update reports, logging instead of propagating errors"""
+        try:
+            await self.reporting_manager.update_all_reports()
+        except Exception as e:
+            self.logger.error(f"Reporting error: {e}")
+    
     async def shutdown(self):
         """Graceful shutdown"""
         self.logger.info("🛑 Shutting down Copytrader v2...")
         self.running = False
-        shutdown_event.set()
+        self.shutdown_event.set()
         
         # Shutdown sync managers
         for sync_manager in self.sync_managers.values():
@@ -164,6 +189,12 @@ class CopytraderApplication:
             except Exception as e:
                 self.logger.error(f"Error shutting down sync manager: {e}")
         
+        # Close shared HTTP sessions once every handler is released
+        try:
+            await BybitAPIHandler.shutdown_all()
+        except Exception as e:
+            self.logger.error(f"Error closing API sessions: {e}")
+        
         # Shutdown Telegram bot
         if self.telegram_bot:
             try:
@@ -180,34 +211,37 @@ class CopytraderApplication:
         
         self.logger.info("✅ Copytrader v2 shutdown complete")
 
-def setup_signal_handlers(app: CopytraderApplication):
+def setup_signal_handlers(shutdown_event: asyncio.Event):
     """Setup signal handlers for graceful shutdown"""
-    def signal_handler(signum, frame):
+    loop = asyncio.get_running_loop()
+    
+    def request_shutdown(signum):
         print(f"\nReceived signal {signum}, initiating shutdown...")
         shutdown_event.set()
-        
-        # Run shutdown in event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            loop.create_task(app.shutdown())
-        else:
-            asyncio.run(app.shutdown())
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
     
+    signals = [signal.SIGINT, signal.SIGTERM]
     # Windows doesn't have SIGHUP
     if hasattr(signal, 'SIGHUP'):
-        signal.signal(signal.SIGHUP, signal_handler)
+        signals.append(signal.SIGHUP)
+    
+    for signum in signals:
+        try:
+            loop.add_signal_handler(signum, request_shutdown, signum)
+        except NotImplementedError:
+            # Windows event loops don't support add_signal_handler
+            signal.signal(
+                signum,
+                lambda num, frame: loop.call_soon_threadsafe(request_shutdown, num)
+            )
 
 async def main():
     """Main entry point"""
-    app = CopytraderApplication()
+    shutdown_event = asyncio.Event()
+    app = CopytraderApplication(shutdown_event)
     
     try:
         # Setup signal handlers
-        setup_signal_handlers(app)
+        setup_signal_handlers(shutdown_event)
         
         # Initialize and run
         await app.initialize()
@@ -221,7 +255,13 @@ async def main():
 
 if __name__ == "__main__":
     # Ensure proper multiprocessing setup
-    multiprocessing.freeze_support()
+    freeze_support()
     
-    # Run the application
-    asyncio.run(main())
\ No newline at end of file
+    # Run the application (on uvloop when installed, default loop otherwise)
+    if UVLOOP_AVAILABLE and sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        if UVLOOP_AVAILABLE:
+            uvloop.install()
+        asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Copytrader v2 - Logging Hot Path
+Per-record helpers used by logger.py, kept fully typed and free of dynamic
+tricks so setup.py can compile this module with mypyc (COPYTRADER_MYPYC=1).
+Without a compiled build the same code simply runs as plain Python
+"""
+import logging
+import traceback
+from typing import Any, Dict, Optional
+
+def merge_extra(
+    context: Dict[str, Any],
+    extra: Optional[Dict[str, Any]],
+    kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Combine logger context, extra and keyword fields (context is returned as-is when alone)"""
+    if extra:
+        combined = dict(context)
+        combined.update(extra)
+        combined.update(kwargs)
+        return combined
+    if kwargs:
+        combined = dict(context)
+        combined.update(kwargs)
+        return combined
+    # Context-only records share the (never mutated) context dict
+    return context
+
+def build_entry(record: logging.LogRecord, timestamp: str) -> Dict[str, Any]:
+    """Build the JSON-serializable dict for a record"""
+    log_entry: Dict[str, Any] = {
+        'timestamp': timestamp,
+        'level': record.levelname,
+        'logger': record.name,
+        'message': record.getMessage(),
+        'module': record.module,
+        'function': record.funcName,
+        'line': record.lineno
+    }
+
+    # Add exception info if present (rare; most records skip this branch)
+    exc_info = record.exc_info
+    if exc_info is not None and exc_info[0] is not None:
+        log_entry['exception'] = {
+            'type': exc_info[0].__name__,
+            'message': str(exc_info[1]) if exc_info[1] else None,
+            'traceback': traceback.format_exception(exc_info[0], exc_info[1], exc_info[2])
+        }
+
+    # Add extra fields; CopytraderLogger always sets them, plain logging calls do not
+    extra_fields: Optional[Dict[str, Any]] = getattr(record, 'extra_fields', None)
+    if extra_fields:
+        log_entry.update(extra_fields)
+
+    return log_entry
@@ -0,0 +1,67 @@
+"""
+Copytrader v2 - Compiled Performance Metrics
+Single-pass drawdown, Sharpe ratio and daily PnL statistics over a balance
+array, JIT-compiled with numba. Importing this module fails without numba;
+reporting_manager then computes the same metrics with numpy
+"""
+import math
+
+from numba import njit
+
+@njit(cache=True)
+def compute_metrics(balances, daily_rf_rate):
+    """
+    Metrics of a non-empty float64 balance array in one pass:
+    (max drawdown %, max drawdown amount, Sharpe ratio, average daily PnL,
+    profitable days). Daily PnL is the difference of consecutive balances;
+    its excess over daily_rf_rate is accumulated with Welford's method
+    """
+    peak = balances[0]
+    max_drawdown_pct = 0.0
+    max_drawdown_amount = 0.0
+
+    count = 0
+    pnl_sum = 0.0
+    profitable_days = 0
+    mean = 0.0
+    m2 = 0.0
+    excess_min = math.inf
+    excess_max = -math.inf
+
+    for i in range(balances.shape[0]):
+        balance = balances[i]
+        if balance > peak:
+            peak = balance
+
+        if peak > 0:
+            drawdown_amount = peak - balance
+            drawdown_pct = drawdown_amount * 100 / peak
+            if drawdown_pct > max_drawdown_pct:
+                max_drawdown_pct = drawdown_pct
+                max_drawdown_amount = drawdown_amount
+
+        if i == 0:
+            continue
+
+        pnl = balance - balances[i - 1]
+        pnl_sum += pnl
+        if pnl > 0:
+            profitable_days += 1
+
+        excess = pnl - daily_rf_rate
+        excess_min = min(excess_min, excess)
+        excess_max = max(excess_max, excess)
+        count += 1
+        delta = excess - mean
+        mean += delta / count
+        m2 += delta * (excess - mean)
+
+    sharpe_ratio = 0.0
+    # A constant series has zero deviation; check exactly, like the numpy path
+    if count >= 2 and excess_max != excess_min:
+        std = math.sqrt(m2 / (count - 1))
+        if std > 0:
+            sharpe_ratio = mean / std * math.sqrt(365.0)
+
+    avg_daily_pnl = pnl_sum / count if count > 0 else 0.0
+    return max_drawdown_pct, max_drawdown_amount, sharpe_ratio, avg_daily_pnl, profitable_days
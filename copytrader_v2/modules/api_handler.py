@@ -4,11 +4,12 @@ Complete async API client with authentication, rate limiting, and error handling
 """
 import asyncio
 import aiohttp
-import hmac
 import hashlib
+import itertools
+import logging
 import time
 import json
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple
 from decimal import Decimal
 from urllib.parse import urlencode
 
@@ -24,6 +25,78 @@ from .exceptions import (
 from .logger import get_logger, log_api_call
 from .security import get_security_manager
 from .file_utils import AccountConfig
+from .private_stream import BybitPrivateStream
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import aiodns  # noqa: F401 - backs aiohttp's AsyncResolver
+    from aiohttp.resolver import AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# Transport-level failures that are retried, per HTTP backend
+if HTTP2_AVAILABLE:
+    _TIMEOUT_ERRORS = (asyncio.TimeoutError, httpx.TimeoutException)
+    _CONNECTION_ERRORS = (aiohttp.ClientError, httpx.TransportError)
+else:
+    _TIMEOUT_ERRORS = (asyncio.TimeoutError,)
+    _CONNECTION_ERRORS = (aiohttp.ClientError,)
+
+# Bybit retCode groups handled specially in _process_response
+_AUTH_RET_CODES = frozenset({10003, 10004, 33004})
+_RATE_LIMIT_RET_CODES = frozenset({10006})
+_ORDER_RET_CODES = frozenset({110001, 110003, 110004})
+
+def _hmac_sha256_pads(key: bytes) -> Tuple["hashlib._Hash", "hashlib._Hash"]:
+    """
+    Precompute the HMAC-SHA256 inner/outer hash states for a key (RFC 2104).
+    Copying these per message avoids re-absorbing the padded key every time.
+    """
+    block_size = 64
+    if len(key) > block_size:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(block_size, b"\x00")
+    inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+    outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+    return inner, outer
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize a request body to compact JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+async def gather_or_cancel(*aws) -> List[Any]:
+    """
+    Like asyncio.gather, but if one awaitable fails the others are cancelled
+    instead of being left running in the background
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
 
 class BybitAPIHandler:
     """
@@ -31,6 +104,17 @@ class BybitAPIHandler:
     Handles authentication, rate limiting, retries, and error recovery
     """
     
+    # Per-instance state lives in slots (no __dict__); the hot request path
+    # reads flattened copies of the account fields instead of account_config.*
+    __slots__ = (
+        'account_config', 'logger', 'security_manager', 'session',
+        'rate_limit_delay', 'max_retries', 'timeout',
+        '_url', '_nickname', '_rate_limit_key',
+        '_request_counter', '_last_count', '_next_allowed', '_rate_lock',
+        '_secret_bytes', '_hmac_inner', '_hmac_outer', '_sign_key_window',
+        '_full_urls', '_header_template', '_query_cache', 'private_stream'
+    )
+    
     # Bybit V5 API endpoints
     ENDPOINTS = {
         # Account & Wallet
@@ -39,7 +123,9 @@ class BybitAPIHandler:
         
         # Trading
         'place_order': '/v5/order/create',
+        'place_order_batch': '/v5/order/create-batch',
         'cancel_order': '/v5/order/cancel',
+        'cancel_order_batch': '/v5/order/cancel-batch',
         'cancel_all_orders': '/v5/order/cancel-all',
         'modify_order': '/v5/order/amend',
         
@@ -64,8 +150,29 @@ class BybitAPIHandler:
         'coin_balance': '/v5/asset/transfer/query-inter-transfer-list'
     }
     
+    # Signature validity window sent with every authenticated request (ms)
+    RECV_WINDOW = "5000"
+    
+    # Maximum number of orders Bybit accepts in one batch request
+    BATCH_MAX_ORDERS = 20
+    
+    # One HTTP session (and connection pool) per base URL, shared by all handlers
+    _shared_sessions: Dict[str, aiohttp.ClientSession] = {}
+    DEFAULT_TIMEOUT = 30
+    # Idle keep-alive period (s); longer than the 10s sync cycle so sockets survive between cycles
+    KEEPALIVE_TIMEOUT = 75
+    
+    # Requests allowed back-to-back before rate_limit_delay spacing applies
+    RATE_LIMIT_BURST = 3
+    
+    # Upper bound on memoized GET query strings per handler
+    QUERY_CACHE_SIZE = 256
+    
     def __init__(self, account_config: AccountConfig):
         self.account_config = account_config
+        self._url = account_config.url
+        self._nickname = account_config.nickname
+        self._rate_limit_key = f"api_{account_config.nickname}"
         self.logger = get_logger('api')
         self.security_manager = get_security_manager()
         
@@ -76,14 +183,41 @@ class BybitAPIHandler:
         )
         
         # Session configuration
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[Union["httpx.AsyncClient", aiohttp.ClientSession]] = None
         self.rate_limit_delay = 0.1  # 100ms between requests
         self.max_retries = 3
-        self.timeout = 30
+        self.timeout = self.DEFAULT_TIMEOUT
+        
+        # Request tracking (next() on a count is a single atomic C call)
+        self._request_counter = itertools.count(1)
+        self._last_count = 0
+        
+        # Rate limiting: theoretical arrival time of the next request (monotonic),
+        # allowed to run up to RATE_LIMIT_BURST - 1 slots ahead of the clock
+        self._next_allowed = 0.0
+        self._rate_lock = asyncio.Lock()
+        
+        # Signing state: the HMAC pad states are derived once and copied per request
+        self._secret_bytes = account_config.api_secret.encode()
+        self._hmac_inner, self._hmac_outer = _hmac_sha256_pads(self._secret_bytes)
+        self._sign_key_window = (account_config.api_key + self.RECV_WINDOW).encode()
+        
+        # Per-request constants: full endpoint URLs and the static auth headers
+        self._full_urls = {
+            name: self._url + path for name, path in self.ENDPOINTS.items()
+        }
+        self._header_template = {
+            'X-BAPI-API-KEY': account_config.api_key,
+            'X-BAPI-RECV-WINDOW': self.RECV_WINDOW,
+            'Content-Type': 'application/json'
+        }
+        
+        # Encoded GET query strings and their signed suffix bytes, keyed by the
+        # (unordered) parameter items
+        self._query_cache: Dict[frozenset, Tuple[str, bytes]] = {}
         
-        # Request tracking
-        self.request_count = 0
-        self.last_request_time = 0
+        # Optional push-based snapshot of positions/orders (see start_private_stream)
+        self.private_stream: Optional[BybitPrivateStream] = None
         
     async def __aenter__(self):
         """Async context manager entry"""
@@ -94,186 +228,299 @@ class BybitAPIHandler:
         """Async context manager exit"""
         await self.close()
     
-    async def initialize(self):
-        """Initialize the API handler"""
-        try:
-            # Create aiohttp session with custom connector
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
+    @property
+    def request_count(self) -> int:
+        """Number of requests issued by this handler"""
+        return self._last_count
+    
+    @classmethod
+    def get_session(cls, url: str) -> Union["httpx.AsyncClient", aiohttp.ClientSession]:
+        """
+        Get the shared session for a base URL, creating it on first use.
+        Uses a multiplexed HTTP/2 httpx client when available, aiohttp otherwise.
+        """
+        session = cls._shared_sessions.get(url)
+        if session is not None and not cls._is_session_closed(session):
+            return session
+        
+        default_headers = {
+            'Content-Type': 'application/json',
+            'User-Agent': 'Copytrader-v2/1.0'
+        }
+        
+        if HTTP2_AVAILABLE:
+            session = httpx.AsyncClient(
+                http2=True,
+                timeout=cls.DEFAULT_TIMEOUT,
+                limits=httpx.Limits(max_connections=32, keepalive_expiry=cls.KEEPALIVE_TIMEOUT),
+                headers=default_headers
+            )
+        else:
+            timeout = aiohttp.ClientTimeout(total=cls.DEFAULT_TIMEOUT)
             connector = aiohttp.TCPConnector(
-                limit=10,  # Maximum pool size
-                limit_per_host=5,  # Maximum pool size per host
+                limit=64,  # Maximum pool size
+                limit_per_host=10,  # Maximum pool size per host
                 ttl_dns_cache=300,  # DNS cache TTL
                 use_dns_cache=True,
+                keepalive_timeout=cls.KEEPALIVE_TIMEOUT,  # Reuse sockets across sync cycles
+                enable_cleanup_closed=True,  # Reclaim transports left by aborted TLS shutdowns
+                # Resolve on the event loop via c-ares instead of getaddrinfo in a thread
+                resolver=AsyncResolver() if AIODNS_AVAILABLE else None,
             )
             
-            self.session = aiohttp.ClientSession(
+            session = aiohttp.ClientSession(
                 timeout=timeout,
                 connector=connector,
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'Copytrader-v2/1.0'
-                }
+                headers=default_headers
             )
+        
+        cls._shared_sessions[url] = session
+        return session
+    
+    @staticmethod
+    def _is_session_closed(session: Union["httpx.AsyncClient", aiohttp.ClientSession]) -> bool:
+        """Check whether a shared session of either backend has been closed"""
+        if HTTP2_AVAILABLE and isinstance(session, httpx.AsyncClient):
+            return session.is_closed
+        return session.closed
+    
+    @classmethod
+    async def shutdown_all(cls):
+        """Close every shared session; call once on application shutdown"""
+        sessions = list(cls._shared_sessions.values())
+        cls._shared_sessions.clear()
+        for session in sessions:
+            if cls._is_session_closed(session):
+                continue
+            if HTTP2_AVAILABLE and isinstance(session, httpx.AsyncClient):
+                await session.aclose()
+            else:
+                await session.close()
+    
+    async def initialize(self):
+        """Initialize the API handler"""
+        try:
+            self.session = self.get_session(self._url)
             
-            self.logger.info("API handler initialized", url=self.account_config.url)
+            self.logger.info("API handler initialized", url=self._url)
             
         except Exception as e:
             self.logger.error(f"Failed to initialize API handler: {e}", exc_info=True)
             raise APIConnectionError(f"Failed to initialize API handler: {e}")
     
     async def close(self):
-        """Close the API handler and cleanup resources"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Release the API handler (the shared session is closed by shutdown_all)"""
+        if self.private_stream:
+            await self.private_stream.stop()
+            self.private_stream = None
+        
+        self.session = None
         
         self.logger.info("API handler closed")
     
-    def _generate_signature(self, timestamp: str, params: str) -> str:
-        """Generate API signature for authentication"""
+    async def start_private_stream(self):
+        """Serve positions and open orders from the private WebSocket stream when live"""
+        if self.private_stream is None:
+            self.private_stream = BybitPrivateStream(self)
+        await self.private_stream.start()
+    
+    def _stream_snapshot_available(self, category: str) -> bool:
+        """Whether reads for a category can be answered from the live stream snapshot"""
+        return (
+            self.private_stream is not None
+            and self.private_stream.is_live
+            and category == BybitPrivateStream.SNAPSHOT_CATEGORY
+        )
+    
+    def _generate_signature(self, timestamp: str, sign_suffix: bytes) -> str:
+        """
+        Generate API signature for authentication
+        sign_suffix is api_key + recv_window + payload (see _sign_suffix)
+        """
         try:
-            recv_window = "5000"  # 5 second window
-            param_str = timestamp + self.account_config.api_key + recv_window + params
-            
-            signature = hmac.new(
-                bytes(self.account_config.api_secret, "utf-8"),
-                bytes(param_str, "utf-8"),
-                hashlib.sha256
-            ).hexdigest()
-            
-            return signature
+            # HMAC-SHA256 over timestamp + api_key + recv_window + payload
+            inner = self._hmac_inner.copy()
+            inner.update(timestamp.encode())
+            inner.update(sign_suffix)
+            outer = self._hmac_outer.copy()
+            outer.update(inner.digest())
+            return outer.hexdigest()
         except Exception as e:
             raise APIAuthenticationError(f"Failed to generate signature: {e}")
     
     def _prepare_headers(self, timestamp: str, signature: str) -> Dict[str, str]:
         """Prepare authentication headers"""
-        return {
-            'X-BAPI-API-KEY': self.account_config.api_key,
-            'X-BAPI-TIMESTAMP': timestamp,
-            'X-BAPI-RECV-WINDOW': "5000",
-            'X-BAPI-SIGN': signature,
-            'Content-Type': 'application/json'
-        }
+        headers = self._header_template.copy()
+        headers['X-BAPI-TIMESTAMP'] = timestamp
+        headers['X-BAPI-SIGN'] = signature
+        return headers
     
     async def _rate_limit_check(self):
         """Implement rate limiting"""
-        now = time.time()
-        if now - self.last_request_time < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - (now - self.last_request_time)
-            await asyncio.sleep(sleep_time)
+        # Reserve the next slot under the lock, then wait for it outside of it.
+        # Up to RATE_LIMIT_BURST requests may start at once (e.g. snapshot()),
+        # after which they are spaced rate_limit_delay apart.
+        async with self._rate_lock:
+            now = time.monotonic()
+            burst_window = (self.RATE_LIMIT_BURST - 1) * self.rate_limit_delay
+            start = max(now, self._next_allowed - burst_window)
+            self._next_allowed = max(self._next_allowed, start) + self.rate_limit_delay
+            delay = start - now
+        
+        if delay > 0:
+            await asyncio.sleep(delay)
         
-        self.last_request_time = time.time()
-        self.request_count += 1
+        self._last_count = next(self._request_counter)
         
         # Check security manager rate limits
         try:
             self.security_manager.check_rate_limit(
-                f"api_{self.account_config.nickname}",
+                self._rate_limit_key,
                 "api_call"
             )
         except Exception as e:
             self.logger.warning(f"Rate limit check failed: {e}")
     
+    def _sign_suffix(self, payload: bytes) -> bytes:
+        """Static part of the signed message that follows the timestamp"""
+        return self._sign_key_window + payload
+    
+    def _encode_query(self, params: Dict[str, Any]) -> Tuple[str, bytes]:
+        """
+        Return the sorted, URL-encoded query string and its signed suffix,
+        memoized per parameter set so repeated polls only hash the timestamp fresh
+        """
+        if not params:
+            return "", self._sign_key_window
+        
+        key = frozenset(params.items())
+        cached = self._query_cache.get(key)
+        if cached is None:
+            if len(self._query_cache) >= self.QUERY_CACHE_SIZE:
+                self._query_cache.clear()
+            query_string = urlencode(sorted(params.items()))
+            cached = (query_string, self._sign_suffix(query_string.encode()))
+            self._query_cache[key] = cached
+        return cached
+    
     async def _make_request(
         self, 
         method: str, 
-        endpoint: str, 
-        params: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0
+        endpoint_key: str, 
+        params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Make authenticated API request with retries"""
+        """Make authenticated API request with retries (endpoint_key is a key of ENDPOINTS)"""
+        
+        endpoint = self.ENDPOINTS[endpoint_key]
         
         if not self.session:
             await self.initialize()
         
-        # Rate limiting
-        await self._rate_limit_check()
-        
         # Prepare parameters
         if params is None:
             params = {}
         
-        timestamp = str(int(time.time() * 1000))
-        
-        try:
-            if method.upper() == 'GET':
-                query_string = urlencode(sorted(params.items())) if params else ""
-                signature = self._generate_signature(timestamp, query_string)
-                url = f"{self.account_config.url}{endpoint}"
-                if query_string:
-                    url += f"?{query_string}"
-                headers = self._prepare_headers(timestamp, signature)
-                
-                log_api_call(self.logger, endpoint, method, None, **params)
-                
-                async with self.session.get(url, headers=headers) as response:
-                    return await self._process_response(response, endpoint, method)
+        # The payload does not depend on the attempt, only the timestamp/signature do
+        is_get = method.upper() == 'GET'
+        if is_get:
+            query_string, sign_suffix = self._encode_query(params)
+            body = None
+            url = self._full_urls[endpoint_key]
+            if query_string:
+                url += f"?{query_string}"
+        else:  # POST, PUT, DELETE
+            body = _json_dumps(params)
+            sign_suffix = self._sign_suffix(body)
+            url = self._full_urls[endpoint_key]
+        
+        attempt = 0
+        while True:
+            # Rate limiting
+            await self._rate_limit_check()
             
-            else:  # POST, PUT, DELETE
-                json_params = json.dumps(params, separators=(',', ':'))
-                signature = self._generate_signature(timestamp, json_params)
-                url = f"{self.account_config.url}{endpoint}"
+            try:
+                # Fresh timestamp per attempt: Bybit rejects signatures older than recv_window
+                timestamp = str(time.time_ns() // 1_000_000)
+                signature = self._generate_signature(timestamp, sign_suffix)
                 headers = self._prepare_headers(timestamp, signature)
                 
-                log_api_call(self.logger, endpoint, method, None, **params)
+                # log_api_call logs at INFO; skip building the record when that is filtered out
+                if self.logger.is_enabled_for(logging.INFO):
+                    log_api_call(self.logger, endpoint, method, None, **params)
                 
-                async with self.session.request(
-                    method, url, data=json_params, headers=headers
-                ) as response:
-                    return await self._process_response(response, endpoint, method)
-                    
-        except aiohttp.ClientError as e:
-            if retry_count < self.max_retries:
-                self.logger.warning(f"Request failed, retrying {retry_count + 1}/{self.max_retries}: {e}")
-                await asyncio.sleep(2 ** retry_count)  # Exponential backoff
-                return await self._make_request(method, endpoint, params, retry_count + 1)
-            else:
-                raise APIConnectionError(f"Network error after {self.max_retries} retries: {e}")
-        
-        except asyncio.TimeoutError:
-            if retry_count < self.max_retries:
-                self.logger.warning(f"Request timeout, retrying {retry_count + 1}/{self.max_retries}")
-                await asyncio.sleep(2 ** retry_count)
-                return await self._make_request(method, endpoint, params, retry_count + 1)
-            else:
-                raise APITimeoutError(f"Request timeout after {self.max_retries} retries")
-        
-        except Exception as e:
-            context = create_error_context(
-                operation=f"{method} {endpoint}",
-                account=self.account_config.nickname,
-                endpoint=endpoint
-            )
-            self.logger.error(f"Unexpected error in API request: {e}", extra=context, exc_info=True)
-            raise APIError(f"Unexpected error: {e}")
+                status, raw = await self._send('GET' if is_get else method, url, headers, body)
+                return self._process_response(status, raw, endpoint, method)
+            
+            except _TIMEOUT_ERRORS:
+                if attempt >= self.max_retries:
+                    raise APITimeoutError(f"Request timeout after {self.max_retries} retries")
+                self.logger.warning(f"Request timeout, retrying {attempt + 1}/{self.max_retries}")
+            
+            except _CONNECTION_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise APIConnectionError(f"Network error after {self.max_retries} retries: {e}")
+                self.logger.warning(f"Request failed, retrying {attempt + 1}/{self.max_retries}: {e}")
+            
+            except APIError:
+                # Already classified (auth, rate limit, bad response) - propagate unchanged
+                raise
+            
+            except Exception as e:
+                context = create_error_context(
+                    operation=f"{method} {endpoint}",
+                    account=self._nickname,
+                    endpoint=endpoint
+                )
+                self.logger.error(f"Unexpected error in API request: {e}", extra=context, exc_info=True)
+                raise APIError(f"Unexpected error: {e}")
+            
+            await asyncio.sleep(2 ** attempt)  # Exponential backoff
+            attempt += 1
     
-    async def _process_response(
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes] = None
+    ) -> Tuple[int, bytes]:
+        """Send a request on the shared session and return (status, raw body)"""
+        if HTTP2_AVAILABLE and isinstance(self.session, httpx.AsyncClient):
+            response = await self.session.request(method, url, headers=headers, content=body)
+            return response.status_code, response.content
+        
+        async with self.session.request(method, url, headers=headers, data=body) as response:
+            return response.status, await response.read()
+    
+    def _process_response(
         self, 
-        response: aiohttp.ClientResponse, 
+        status: int, 
+        raw: bytes, 
         endpoint: str, 
         method: str
     ) -> Dict[str, Any]:
         """Process API response and handle errors"""
         
-        log_api_call(self.logger, endpoint, method, response.status)
+        if self.logger.is_enabled_for(logging.INFO):
+            log_api_call(self.logger, endpoint, method, status)
         
         # Handle HTTP errors
-        if response.status == 401:
+        if status == 401:
             raise APIAuthenticationError("Authentication failed - check API credentials")
-        elif response.status == 403:
+        elif status == 403:
             raise APIAuthenticationError("Access forbidden - insufficient permissions")
-        elif response.status == 429:
+        elif status == 429:
             raise APIRateLimitError("Rate limit exceeded")
-        elif response.status >= 500:
-            raise APIConnectionError(f"Server error: {response.status}")
-        elif response.status >= 400:
-            error_text = await response.text()
-            raise APIResponseError(f"Client error {response.status}: {error_text}")
+        elif status >= 500:
+            raise APIConnectionError(f"Server error: {status}")
+        elif status >= 400:
+            error_text = raw.decode('utf-8', errors='replace')
+            raise APIResponseError(f"Client error {status}: {error_text}")
         
         # Parse JSON response
         try:
-            data = await response.json()
-        except json.JSONDecodeError as e:
+            data = _json_loads(raw)
+        except ValueError as e:
             raise APIResponseError(f"Invalid JSON response: {e}")
         
         # Check Bybit API error codes
@@ -282,11 +529,11 @@ class BybitAPIHandler:
             ret_msg = data.get('retMsg', 'Unknown error')
             
             # Map specific Bybit error codes
-            if ret_code in [10003, 10004, 33004]:  # Auth errors
+            if ret_code in _AUTH_RET_CODES:  # Auth errors
                 raise APIAuthenticationError(f"Authentication error: {ret_msg}")
-            elif ret_code == 10006:  # Rate limit
+            elif ret_code in _RATE_LIMIT_RET_CODES:  # Rate limit
                 raise APIRateLimitError(f"Rate limit: {ret_msg}")
-            elif ret_code in [110001, 110003, 110004]:  # Order errors
+            elif ret_code in _ORDER_RET_CODES:  # Order errors
                 self.logger.warning(f"Order execution error {ret_code}: {ret_msg}")
                 # Don't raise exception for order errors, return the response
                 return data
@@ -300,27 +547,62 @@ class BybitAPIHandler:
     async def get_wallet_balance(self, account_type: str = "UNIFIED") -> Dict[str, Any]:
         """Get wallet balance"""
         params = {"accountType": account_type}
-        response = await self._make_request('GET', self.ENDPOINTS['wallet_balance'], params)
+        response = await self._make_request('GET', 'wallet_balance', params)
         return response.get('result', {})
     
     async def get_positions(self, category: str = "linear", symbol: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get positions"""
+        """Get positions (from the private stream snapshot when live)"""
+        if self._stream_snapshot_available(category):
+            return self.private_stream.get_positions(symbol)
+        
         params = {"category": category}
         if symbol:
             params["symbol"] = symbol
         
-        response = await self._make_request('GET', self.ENDPOINTS['position_list'], params)
+        response = await self._make_request('GET', 'position_list', params)
         return response.get('result', {}).get('list', [])
     
     async def get_open_orders(self, category: str = "linear", symbol: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get open orders"""
+        """Get open orders (from the private stream snapshot when live)"""
+        if self._stream_snapshot_available(category):
+            return self.private_stream.get_open_orders(symbol)
+        
         params = {"category": category}
         if symbol:
             params["symbol"] = symbol
         
-        response = await self._make_request('GET', self.ENDPOINTS['open_orders'], params)
+        response = await self._make_request('GET', 'open_orders', params)
         return response.get('result', {}).get('list', [])
     
+    async def snapshot(self, category: str = "linear", include_wallet: bool = True) -> Dict[str, Any]:
+        """
+        Fetch positions, open orders and (optionally) the wallet balance concurrently
+        Returns a dict with 'positions', 'open_orders' and 'wallet' keys
+        A failed position or order fetch raises (cancelling the other calls); a
+        failed wallet fetch is logged and leaves 'wallet' as None
+        """
+        calls = [
+            self.get_positions(category=category),
+            self.get_open_orders(category=category)
+        ]
+        if include_wallet:
+            calls.append(self._wallet_balance_or_none())
+        
+        results = await gather_or_cancel(*calls)
+        return {
+            'positions': results[0],
+            'open_orders': results[1],
+            'wallet': results[2] if include_wallet else None
+        }
+    
+    async def _wallet_balance_or_none(self) -> Optional[Dict[str, Any]]:
+        """Wallet balance for snapshot(), None if it could not be fetched"""
+        try:
+            return await self.get_wallet_balance()
+        except Exception as e:
+            self.logger.error(f"Failed to get wallet balance: {e}")
+            return None
+    
     async def get_order_history(
         self, 
         category: str = "linear", 
@@ -335,7 +617,7 @@ class BybitAPIHandler:
         if symbol:
             params["symbol"] = symbol
         
-        response = await self._make_request('GET', self.ENDPOINTS['order_history'], params)
+        response = await self._make_request('GET', 'order_history', params)
         return response.get('result', {}).get('list', [])
     
     async def get_execution_list(
@@ -352,12 +634,11 @@ class BybitAPIHandler:
         if symbol:
             params["symbol"] = symbol
         
-        response = await self._make_request('GET', self.ENDPOINTS['execution_list'], params)
+        response = await self._make_request('GET', 'execution_list', params)
         return response.get('result', {}).get('list', [])
     
-    async def place_order(
-        self,
-        category: str,
+    @staticmethod
+    def build_order_request(
         symbol: str,
         side: str,
         order_type: str,
@@ -367,9 +648,8 @@ class BybitAPIHandler:
         reduce_only: bool = False,
         close_on_trigger: bool = False
     ) -> Dict[str, Any]:
-        """Place a new order"""
+        """Build the per-order request body shared by single and batch order placement"""
         params = {
-            "category": category,
             "symbol": symbol,
             "side": side,
             "orderType": order_type,
@@ -384,9 +664,61 @@ class BybitAPIHandler:
         if close_on_trigger:
             params["closeOnTrigger"] = "true"
         
-        response = await self._make_request('POST', self.ENDPOINTS['place_order'], params)
+        return params
+    
+    async def place_order(
+        self,
+        category: str,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: str,
+        price: Optional[str] = None,
+        time_in_force: str = "GTC",
+        reduce_only: bool = False,
+        close_on_trigger: bool = False
+    ) -> Dict[str, Any]:
+        """Place a new order"""
+        params = {"category": category}
+        params.update(self.build_order_request(
+            symbol, side, order_type, qty, price, time_in_force, reduce_only, close_on_trigger
+        ))
+        
+        response = await self._make_request('POST', 'place_order', params)
         return response.get('result', {})
     
+    async def place_orders_batch(self, category: str, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Place several orders, sending at most BATCH_MAX_ORDERS per request"""
+        return await self._send_batch('place_order_batch', category, orders)
+    
+    async def cancel_orders_batch(self, category: str, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Cancel several orders (each item needs symbol and orderId or orderLinkId)"""
+        return await self._send_batch('cancel_order_batch', category, orders)
+    
+    async def _send_batch(self, endpoint_key: str, category: str, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send a batch endpoint request in chunks and collect the per-order results
+        Bybit accepts a batch as a whole (retCode 0) and reports each order's
+        outcome in retExtInfo.list; that 'code' and 'msg' are merged into the
+        matching result entry, and a non-zero code means the order was rejected
+        """
+        results = []
+        for start in range(0, len(orders), self.BATCH_MAX_ORDERS):
+            params = {
+                "category": category,
+                "request": orders[start:start + self.BATCH_MAX_ORDERS]
+            }
+            response = await self._make_request('POST', endpoint_key, params)
+            items = response.get('result', {}).get('list', [])
+            statuses = (response.get('retExtInfo') or {}).get('list', [])
+            for i, item in enumerate(items):
+                status = statuses[i] if i < len(statuses) else {}
+                merged = dict(item)
+                merged['code'] = int(status.get('code', 0))
+                merged['msg'] = status.get('msg', '')
+                results.append(merged)
+        return results
+    
     async def cancel_order(
         self,
         category: str,
@@ -407,7 +739,7 @@ class BybitAPIHandler:
         else:
             raise ValueError("Either order_id or order_link_id must be provided")
         
-        response = await self._make_request('POST', self.ENDPOINTS['cancel_order'], params)
+        response = await self._make_request('POST', 'cancel_order', params)
         return response.get('result', {})
     
     async def cancel_all_orders(self, category: str, symbol: Optional[str] = None) -> Dict[str, Any]:
@@ -416,7 +748,7 @@ class BybitAPIHandler:
         if symbol:
             params["symbol"] = symbol
         
-        response = await self._make_request('POST', self.ENDPOINTS['cancel_all_orders'], params)
+        response = await self._make_request('POST', 'cancel_all_orders', params)
         return response.get('result', {})
     
     async def set_leverage(
@@ -434,7 +766,7 @@ class BybitAPIHandler:
             "sellLeverage": sell_leverage
         }
         
-        response = await self._make_request('POST', self.ENDPOINTS['set_leverage'], params)
+        response = await self._make_request('POST', 'set_leverage', params)
         return response.get('result', {})
     
     async def set_trading_stop(
@@ -459,7 +791,7 @@ class BybitAPIHandler:
         if take_profit:
             params["takeProfit"] = take_profit
         
-        response = await self._make_request('POST', self.ENDPOINTS['trading_stop'], params)
+        response = await self._make_request('POST', 'trading_stop', params)
         return response.get('result', {})
     
     async def get_instruments_info(
@@ -472,7 +804,7 @@ class BybitAPIHandler:
         if symbol:
             params["symbol"] = symbol
         
-        response = await self._make_request('GET', self.ENDPOINTS['instruments_info'], params)
+        response = await self._make_request('GET', 'instruments_info', params)
         return response.get('result', {}).get('list', [])
     
     async def get_orderbook(self, category: str, symbol: str, limit: int = 25) -> Dict[str, Any]:
@@ -483,12 +815,12 @@ class BybitAPIHandler:
             "limit": str(limit)
         }
         
-        response = await self._make_request('GET', self.ENDPOINTS['orderbook'], params)
+        response = await self._make_request('GET', 'orderbook', params)
         return response.get('result', {})
     
     async def get_account_info(self) -> Dict[str, Any]:
         """Get account information"""
-        response = await self._make_request('GET', self.ENDPOINTS['account_info'])
+        response = await self._make_request('GET', 'account_info')
         return response.get('result', {})
     
     # Utility methods
@@ -3,8 +3,17 @@ Copytrader v2 - Custom Exception Hierarchy
 Complete exception system for precise error handling and recovery
 """
 from typing import Optional, Dict, Any, Union
+from collections import Counter
+import functools
+from datetime import datetime, timezone
+import json
+import sys
 import traceback
 
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO 8601 string"""
+    return datetime.now(timezone.utc).isoformat()
+
 class CopytraderError(Exception):
     """Base exception for all Copytrader-related errors"""
     
@@ -13,20 +22,17 @@ class CopytraderError(Exception):
         self.message = message
         self.error_code = error_code
         self.context = context or {}
-        self.timestamp = self._get_timestamp()
-    
-    def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        self.timestamp = _utcnow_iso()
     
     def __str__(self) -> str:
-        parts = [self.message]
-        if self.error_code:
-            parts.append(f"Code: {self.error_code}")
-        if self.context:
-            parts.append(f"Context: {self.context}")
-        return " | ".join(parts)
+        # Most internal raises carry neither a code nor context
+        if not self.error_code:
+            if not self.context:
+                return self.message
+            return f"{self.message} | Context: {self.context}"
+        if not self.context:
+            return f"{self.message} | Code: {self.error_code}"
+        return f"{self.message} | Code: {self.error_code} | Context: {self.context}"
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for logging/reporting"""
@@ -36,7 +42,8 @@ class CopytraderError(Exception):
             'error_code': self.error_code,
             'context': self.context,
             'timestamp': self.timestamp,
-            'traceback': traceback.format_exc()
+            # Only format a traceback while an exception is actually being handled
+            'traceback': traceback.format_exc() if sys.exc_info()[0] is not None else ''
         }
 
 # Configuration related exceptions
@@ -221,6 +228,41 @@ class ValidationError(SecurityError):
     """Raised when input validation fails"""
     pass
 
+# Common exceptions mapped to specific Copytrader exceptions, keyed by type
+_EXCEPTION_MAP = {
+    ConnectionError: APIConnectionError,
+    TimeoutError: APITimeoutError,
+    ValueError: DataValidationError,
+    KeyError: ConfigurationError,
+    FileNotFoundError: FileOperationError,
+    PermissionError: FileOperationError,
+    json.JSONDecodeError: DataSerializationError,
+}
+
+# Exceptions matched by class name, so library types need not be imported here;
+# e.g. requests.ConnectionError and requests.JSONDecodeError do not subclass the
+# builtin types above but map by name like them, ahead of their RequestException base
+_EXCEPTION_NAME_MAP = {
+    'ConnectionError': APIConnectionError,
+    'JSONDecodeError': DataSerializationError,
+    'HTTPError': APIError,
+    'RequestException': APINetworkError,
+}
+
+@functools.lru_cache(maxsize=256)
+def _resolve_exception_class(exception_type: type) -> type:
+    """Find the Copytrader exception for a type, most specific base class first (memoized per type)"""
+    # The concrete type's own name wins, as in the original name-based mapping
+    exception_class = _EXCEPTION_NAME_MAP.get(exception_type.__name__)
+    if exception_class is not None:
+        return exception_class
+    
+    for base in exception_type.__mro__:
+        exception_class = _EXCEPTION_MAP.get(base) or _EXCEPTION_NAME_MAP.get(base.__name__)
+        if exception_class is not None:
+            return exception_class
+    return CopytraderError
+
 def handle_exception_with_context(
     exception: Exception, 
     context: Dict[str, Any], 
@@ -240,20 +282,7 @@ def handle_exception_with_context(
     error_message = str(exception)
     error_type = type(exception).__name__
     
-    # Map common exceptions to specific Copytrader exceptions
-    exception_mapping = {
-        'ConnectionError': APIConnectionError,
-        'TimeoutError': APITimeoutError,
-        'ValueError': DataValidationError,
-        'KeyError': ConfigurationError,
-        'FileNotFoundError': FileOperationError,
-        'PermissionError': FileOperationError,
-        'JSONDecodeError': DataSerializationError,
-        'HTTPError': APIError,
-        'RequestException': APINetworkError,
-    }
-    
-    exception_class = exception_mapping.get(error_type, CopytraderError)
+    exception_class = _resolve_exception_class(type(exception))
     
     # Create new exception with context
     new_exception = exception_class(
@@ -287,11 +316,9 @@ def create_error_context(
     Returns:
         Context dictionary
     """
-    from datetime import datetime
-    
     context = {
         'operation': operation,
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': _utcnow_iso()
     }
     
     if user_id is not None:
@@ -300,46 +327,46 @@ def create_error_context(
         context['symbol'] = symbol
     if account is not None:
         context['account'] = account
-        
-    context.update(kwargs)
+    if kwargs:
+        context.update(kwargs)
     return context
 
 class ErrorRecoveryManager:
     """Manages error recovery strategies"""
     
+    # Errors that retrying cannot fix
+    _NON_RETRYABLE = (
+        AuthenticationError,
+        ConfigurationError,
+        ValidationError,
+        InvalidConfigurationError
+    )
+    
     def __init__(self, max_retries: int = 3, base_delay: float = 1.0):
         self.max_retries = max_retries
         self.base_delay = base_delay
-        self.retry_counts = {}
+        self.retry_counts: Counter = Counter()  # missing operations count as 0
+        # Backoff delays for retry counts 0..max_retries
+        self._delays = tuple(base_delay * (1 << i) for i in range(max_retries + 1))
     
     def should_retry(self, operation: str, exception: Exception) -> bool:
         """Determine if an operation should be retried"""
-        retry_count = self.retry_counts.get(operation, 0)
-        
-        if retry_count >= self.max_retries:
+        if self.retry_counts[operation] >= self.max_retries:
             return False
         
         # Don't retry certain types of errors
-        non_retryable = (
-            AuthenticationError,
-            ConfigurationError,
-            ValidationError,
-            InvalidConfigurationError
-        )
-        
-        if isinstance(exception, non_retryable):
-            return False
-        
-        return True
+        return not isinstance(exception, self._NON_RETRYABLE)
     
     def get_retry_delay(self, operation: str) -> float:
         """Get delay before retry (exponential backoff)"""
-        retry_count = self.retry_counts.get(operation, 0)
+        retry_count = self.retry_counts[operation]
+        if retry_count < len(self._delays):
+            return self._delays[retry_count]
         return self.base_delay * (2 ** retry_count)
     
     def record_retry(self, operation: str):
         """Record a retry attempt"""
-        self.retry_counts[operation] = self.retry_counts.get(operation, 0) + 1
+        self.retry_counts[operation] += 1
     
     def reset_retries(self, operation: str):
         """Reset retry count for successful operation"""
@@ -4,20 +4,54 @@ Handles all file operations, directory structure, and account configurations
 """
 import json
 import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple
 from datetime import datetime, timezone, timedelta
 import shutil
 import tempfile
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass, fields, replace
 from .exceptions import (
     FileOperationError, 
     ConfigurationError, 
     DataSerializationError,
     create_error_context
 )
+from .logger import get_logger
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON file contents (orjson.JSONDecodeError subclasses json.JSONDecodeError)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, matching json.dump(indent=2, ensure_ascii=False)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Fields every account config file must define
+_REQUIRED_ACCOUNT_FIELDS = frozenset({'nickname', 'api_key', 'api_secret', 'url', 'account_type', 'role'})
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class AccountConfig:
     """Account configuration data structure"""
     nickname: str
@@ -36,6 +70,12 @@ class AccountConfig:
     drawdown_alerted_levels: Optional[List[float]] = None
     last_trade_id: Optional[str] = None
     enabled: bool = True
+    
+    def _to_json_dict(self) -> Dict[str, Any]:
+        """Shallow field dict for serialization (asdict() would deep-copy every list)"""
+        return {name: getattr(self, name) for name in _ACCOUNT_CONFIG_FIELDS}
+
+_ACCOUNT_CONFIG_FIELDS = tuple(field.name for field in fields(AccountConfig))
 
 def ensure_directory_structure():
     """Create all necessary directories if they don't exist"""
@@ -62,8 +102,28 @@ def ensure_directory_structure():
         except Exception as e:
             raise FileOperationError(f"Failed to create directory {directory}: {e}")
 
+# Last parsed account configs and the directory state they were parsed from
+_accounts_cache: Dict[str, Any] = {'key': None, 'value': None}
+
+# Per-file parse memo: path -> ((mtime_ns, size), AccountConfig)
+_config_file_cache: Dict[str, Tuple[Tuple[int, int], AccountConfig]] = {}
+
+def _accounts_cache_key(accounts_dir: Path) -> Tuple[int, int]:
+    """Directory mtime (files added/removed) and newest config file mtime (files edited)"""
+    with os.scandir(accounts_dir) as entries:
+        newest = max(
+            (entry.stat().st_mtime_ns for entry in entries
+             if entry.name.endswith('.json') and entry.is_file()),
+            default=0
+        )
+    return accounts_dir.stat().st_mtime_ns, newest
+
+def _copy_accounts(accounts: Dict[str, AccountConfig]) -> Dict[str, AccountConfig]:
+    """Per-call copies so callers can modify configs without touching the cache"""
+    return {nickname: replace(account) for nickname, account in accounts.items()}
+
 def load_account_configs() -> Dict[str, AccountConfig]:
-    """Load all account configurations from data/accounts/"""
+    """Load all account configurations from data/accounts/ (re-parsed only when changed)"""
     accounts = {}
     accounts_dir = Path("data/accounts")
     
@@ -72,34 +132,57 @@ def load_account_configs() -> Dict[str, AccountConfig]:
         create_sample_configs()
         
     try:
+        cache_key = _accounts_cache_key(accounts_dir)
+        if cache_key == _accounts_cache['key']:
+            return _copy_accounts(_accounts_cache['value'])
+        
+        file_cache = {}
         for config_file in accounts_dir.glob("*.json"):
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            # Only files that changed since the last load are re-read and re-parsed
+            stat = config_file.stat()
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            cached = _config_file_cache.get(str(config_file))
+            if cached is not None and cached[0] == file_key:
+                account = cached[1]
+                accounts[account.nickname] = account
+                file_cache[str(config_file)] = cached
+                continue
+            
+            config_data = _json_loads(config_file.read_bytes())
                 
             # Validate required fields
-            required_fields = ['nickname', 'api_key', 'api_secret', 'url', 'account_type', 'role']
-            for field in required_fields:
-                if field not in config_data:
-                    raise ConfigurationError(f"Missing required field '{field}' in {config_file.name}")
+            missing = _REQUIRED_ACCOUNT_FIELDS - config_data.keys()
+            if missing:
+                raise ConfigurationError(
+                    f"Missing required fields {', '.join(sorted(missing))} in {config_file.name}"
+                )
             
             # Create AccountConfig object
             account = AccountConfig(**config_data)
             accounts[account.nickname] = account
+            file_cache[str(config_file)] = (file_key, account)
+        
+        # Rebuilt each pass so deleted files drop out
+        _config_file_cache.clear()
+        _config_file_cache.update(file_cache)
+        _accounts_cache['key'] = cache_key
+        _accounts_cache['value'] = accounts
             
     except json.JSONDecodeError as e:
         raise DataSerializationError(f"Invalid JSON in account config: {e}")
     except Exception as e:
         raise FileOperationError(f"Failed to load account configs: {e}")
     
-    return accounts
+    return _copy_accounts(accounts)
 
 def save_account_config(account: AccountConfig):
     """Save account configuration to file"""
     config_file = Path(f"data/accounts/{account.nickname}.json")
     
     try:
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(account), f, indent=2, ensure_ascii=False)
+        # Replace rather than rewrite in place: backups may hard-link this file
+        save_json_file(config_file, account._to_json_dict(), backup=False)
+        _accounts_cache['key'] = None
     except Exception as e:
         raise FileOperationError(f"Failed to save account config for {account.nickname}: {e}")
 
@@ -139,35 +222,47 @@ def load_json_file(file_path: Union[str, Path], default: Any = None) -> Any:
         if not file_path.exists():
             return default
             
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _json_loads(file_path.read_bytes())
             
     except json.JSONDecodeError as e:
         raise DataSerializationError(f"Invalid JSON in {file_path}: {e}")
     except Exception as e:
         raise FileOperationError(f"Failed to load {file_path}: {e}")
 
-def save_json_file(file_path: Union[str, Path], data: Any, backup: bool = True):
-    """Safely save JSON file with atomic write and optional backup"""
+def save_json_file(file_path: Union[str, Path], data: Any, backup: bool = True, durable: bool = True):
+    """
+    Safely save JSON file with atomic write and optional backup
+    With durable=False the file is written directly (no temp file + rename); a crash
+    mid-write can leave it truncated, so use this only for files whose loader
+    tolerates that (see load_sync_state)
+    """
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        # Create backup if file exists and backup is requested
+        # Create backup if file exists and backup is requested; nanosecond names
+        # keep saves within the same second from overwriting each other's backup,
+        # and a hard link suffices since the file is replaced below, not rewritten
         if backup and file_path.exists():
-            backup_path = file_path.with_suffix(f".backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-            shutil.copy2(file_path, backup_path)
+            backup_path = file_path.with_suffix(f".backup.{time.time_ns()}.json")
+            _link_or_copy(file_path, backup_path)
+        
+        if not durable:
+            # Unlink first so a hard-linked backup of the old file keeps its content
+            if file_path.exists():
+                file_path.unlink()
+            file_path.write_bytes(_json_dumps(data))
+            return
         
         # Atomic write using temporary file
         with tempfile.NamedTemporaryFile(
-            mode='w', 
-            encoding='utf-8', 
+            mode='wb', 
             dir=file_path.parent,
             delete=False,
             suffix='.tmp'
         ) as tmp_file:
-            json.dump(data, tmp_file, indent=2, ensure_ascii=False)
             tmp_path = Path(tmp_file.name)
+            tmp_file.write(_json_dumps(data))
         
         # Replace original file
         tmp_path.replace(file_path)
@@ -179,9 +274,17 @@ def save_json_file(file_path: Union[str, Path], data: Any, backup: bool = True):
         raise FileOperationError(f"Failed to save {file_path}: {e}")
 
 def get_balance_history_file(account: str) -> Path:
-    """Get path to balance history file for account"""
+    """Get path to balance history file for account (JSON Lines, one entry per line)"""
+    return Path(f"data/history/{account}_balance_history.jsonl")
+
+def _legacy_balance_history_file(account: str) -> Path:
+    """Path of the whole-file JSON balance history used before the JSON Lines log"""
     return Path(f"data/reports/{account}_balance_history.json")
 
+def get_balance_history_parquet_file(account: str) -> Path:
+    """Get path to the columnar (Parquet) cache of an account's balance history"""
+    return Path(f"data/reports/{account}_balance_history.parquet")
+
 def get_pnl_summary_file(account: str) -> Path:
     """Get path to PnL summary file for account"""
     return Path(f"data/reports/{account}_pnl_summary.json")
@@ -190,20 +293,159 @@ def get_sync_state_file(master: str, slave: str) -> Path:
     """Get path to sync state file for account pair"""
     return Path(f"data/sync_state/{master}_{slave}_state.json")
 
+def _json_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize one entry as a compact JSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+    return json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
 def save_balance_history(account: str, balance_data: List[Dict[str, Any]]):
-    """Save balance history for an account"""
+    """Rewrite the whole balance history for an account (atomic; used for compaction)"""
     file_path = get_balance_history_file(account)
-    save_json_file(file_path, {
-        "account": account,
-        "last_updated": datetime.now(timezone.utc).isoformat(),
-        "data": balance_data
-    })
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode='wb',
+            dir=file_path.parent,
+            delete=False,
+            suffix='.tmp'
+        ) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+            tmp_file.write(b''.join(_json_line(entry) for entry in balance_data))
+        
+        tmp_path.replace(file_path)
+        
+    except Exception as e:
+        if 'tmp_path' in locals() and tmp_path.exists():
+            tmp_path.unlink()
+        raise FileOperationError(f"Failed to save {file_path}: {e}")
+
+def save_balance_history_append(account: str, entry: Dict[str, Any]):
+    """Append one entry to an account's balance history (a single small O_APPEND write)"""
+    file_path = get_balance_history_file(account)
+    if not file_path.exists():
+        load_balance_history(account)  # Migrates a legacy JSON history first
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        with open(file_path, 'ab+') as f:
+            line = _json_line(entry)
+            # Start on a fresh line if an earlier append was cut off mid-line
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    line = b'\n' + line
+            f.write(line)
+    except OSError as e:
+        raise FileOperationError(f"Failed to append to {file_path}: {e}")
 
 def load_balance_history(account: str) -> List[Dict[str, Any]]:
     """Load balance history for an account"""
     file_path = get_balance_history_file(account)
-    data = load_json_file(file_path, {"data": []})
-    return data.get("data", [])
+    
+    try:
+        data = file_path.read_bytes()
+    except FileNotFoundError:
+        # Convert a whole-file JSON history from before the JSON Lines log
+        legacy = load_json_file(_legacy_balance_history_file(account))
+        if not legacy:
+            return []
+        history = legacy.get("data", [])
+        save_balance_history(account, history)
+        return history
+    except OSError as e:
+        raise FileOperationError(f"Failed to load {file_path}: {e}")
+    
+    return _parse_history_lines(data)
+
+def load_balance_history_tail(account: str, offset: int = 0) -> Tuple[List[Dict[str, Any]], int, Optional[int]]:
+    """
+    Load the balance history entries written after a byte offset
+    Returns the entries, the offset to continue from and the file's identity
+    (inode), None if the file is missing. Only complete lines are consumed, so
+    a line still being appended is read by the next call
+    """
+    file_path = get_balance_history_file(account)
+    
+    try:
+        with open(file_path, 'rb') as f:
+            identity = os.fstat(f.fileno()).st_ino
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return [], 0, None
+    except OSError as e:
+        raise FileOperationError(f"Failed to load {file_path}: {e}")
+    
+    end = data.rfind(b'\n') + 1
+    return _parse_history_lines(data[:end]), offset + end, identity
+
+def _parse_history_lines(data: bytes) -> List[Dict[str, Any]]:
+    """Parse JSON Lines history data, skipping blank and torn lines"""
+    history = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            history.append(_json_loads(line))
+        except json.JSONDecodeError:
+            continue  # Torn last line of an interrupted append
+    return history
+
+def get_balance_history_version(account: str) -> Optional[str]:
+    """Version tag (mtime and size) of an account's balance history file, None if missing"""
+    try:
+        stat = get_balance_history_file(account).stat()
+    except FileNotFoundError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+def save_balance_history_parquet(account: str, timestamps: Any, balances: Any, version: str):
+    """
+    Write the Parquet cache of a balance history
+    timestamps (datetime64, NaT allowed) and balances (float64) are stored as
+    timestamp[us, UTC] and float64 columns, tagged with the version of the
+    JSON history they were parsed from
+    """
+    file_path = get_balance_history_parquet_file(account)
+    table = pa.table({
+        'timestamp': pa.array(timestamps, type=pa.timestamp('us', tz='UTC'), from_pandas=True),
+        'balance': pa.array(balances, type=pa.float64()),
+    }).replace_schema_metadata({'source_version': version})
+    
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, tmp_path, compression='snappy', use_dictionary=False)
+        os.replace(tmp_path, file_path)
+    except Exception as e:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise FileOperationError(f"Failed to save {file_path}: {e}")
+
+def load_balance_history_parquet(account: str) -> Optional[Tuple[Any, Any]]:
+    """
+    Load (timestamps, balances) arrays from the Parquet cache
+    Returns None when there is no cache or it was built from an older history
+    """
+    file_path = get_balance_history_parquet_file(account)
+    version = get_balance_history_version(account)
+    if version is None or not file_path.exists():
+        return None
+    
+    try:
+        table = pq.read_table(file_path)
+    except Exception:
+        return None  # Unreadable cache; the caller rebuilds it
+    
+    metadata = table.schema.metadata or {}
+    if metadata.get(b'source_version') != version.encode():
+        return None
+    
+    timestamps = table.column('timestamp').to_numpy(zero_copy_only=False)
+    balances = table.column('balance').to_numpy(zero_copy_only=False)
+    return timestamps, balances
 
 def save_pnl_summary(account: str, pnl_data: Dict[str, Any]):
     """Save PnL summary for an account"""
@@ -227,22 +469,32 @@ def load_pnl_summary(account: str) -> Dict[str, Any]:
 def save_sync_state(master: str, slave: str, state_data: Dict[str, Any]):
     """Save synchronization state for account pair"""
     file_path = get_sync_state_file(master, slave)
+    # Rewritten every sync cycle; load_sync_state falls back to defaults if a
+    # crash left it truncated
     save_json_file(file_path, {
         "master": master,
         "slave": slave,
         "last_updated": datetime.now(timezone.utc).isoformat(),
         **state_data
-    })
+    }, backup=False, durable=False)
 
 def load_sync_state(master: str, slave: str) -> Dict[str, Any]:
     """Load synchronization state for account pair"""
     file_path = get_sync_state_file(master, slave)
-    return load_json_file(file_path, {
+    default_state = {
         "last_trade_id": None,
         "position_ids": {},
         "order_ids": {},
         "last_sync": None
-    })
+    }
+    
+    try:
+        return load_json_file(file_path, default_state)
+    except DataSerializationError as e:
+        # Sync state is written non-atomically, so a crash mid-write can leave
+        # it truncated; starting from defaults beats never starting the pair
+        get_logger('sync').warning(f"Discarding unreadable sync state, starting fresh: {e}")
+        return default_state
 
 def reset_daily_data(account: str):
     """Reset daily data for an account (called at UTC 00:00)"""
@@ -266,9 +518,18 @@ def reset_daily_data(account: str):
     except Exception as e:
         raise FileOperationError(f"Failed to reset daily data for {account}: {e}")
 
+def _remove_files_older_than(directory: str, cutoff: float):
+    """Recursively delete files whose mtime (epoch seconds) is before cutoff"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_files_older_than(entry.path, cutoff)
+            elif entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                os.unlink(entry.path)
+
 def cleanup_old_files(days_to_keep: int = 30):
     """Clean up old log files and backups"""
-    cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+    cutoff = time.time() - timedelta(days=days_to_keep).total_seconds()
     
     cleanup_dirs = [
         Path("data/logs/archive"),
@@ -281,15 +542,29 @@ def cleanup_old_files(days_to_keep: int = 30):
             continue
             
         try:
-            for file_path in cleanup_dir.rglob("*"):
-                if file_path.is_file():
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_time < cutoff_date:
-                        file_path.unlink()
+            _remove_files_older_than(str(cleanup_dir), cutoff)
         except Exception as e:
             # Log error but don't fail
             pass
 
+# Data directories whose files may change in place (account configs are edited
+# by hand, balance history is appended to); backups and restores copy these
+_COPIED_BACKUP_DIRS = frozenset({"accounts", "history"})
+
+def _link_or_copy(src: str, dst: str):
+    """
+    Hard-link a file into a backup, copying only when linking is not possible
+    (other filesystem, no link support). Only used for reports and sync state,
+    whose writers replace files via rename and never rewrite them in place, so
+    a link keeps the old content. Directories in _COPIED_BACKUP_DIRS are copied.
+    """
+    if os.path.lexists(dst):
+        os.unlink(dst)  # Re-running a backup under an existing name
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 def backup_data(backup_name: Optional[str] = None):
     """Create a backup of all important data"""
     if backup_name is None:
@@ -299,16 +574,22 @@ def backup_data(backup_name: Optional[str] = None):
     backup_dir.mkdir(parents=True, exist_ok=True)
     
     try:
-        # Backup account configs
-        shutil.copytree("data/accounts", backup_dir / "accounts", dirs_exist_ok=True)
+        # Backup account configs; these are edited by hand (possibly in place),
+        # so they are copied rather than hard-linked
+        shutil.copytree("data/accounts", backup_dir / "accounts", copy_function=shutil.copy2, dirs_exist_ok=True)
         
         # Backup reports
         if Path("data/reports").exists():
-            shutil.copytree("data/reports", backup_dir / "reports", dirs_exist_ok=True)
+            shutil.copytree("data/reports", backup_dir / "reports", copy_function=_link_or_copy, dirs_exist_ok=True)
         
         # Backup sync state
         if Path("data/sync_state").exists():
-            shutil.copytree("data/sync_state", backup_dir / "sync_state", dirs_exist_ok=True)
+            shutil.copytree("data/sync_state", backup_dir / "sync_state", copy_function=_link_or_copy, dirs_exist_ok=True)
+        
+        # Backup balance history; these files are appended in place, so they
+        # are copied rather than hard-linked
+        if Path("data/history").exists():
+            shutil.copytree("data/history", backup_dir / "history", copy_function=shutil.copy2, dirs_exist_ok=True)
         
         # Create backup manifest
         manifest = {
@@ -317,7 +598,8 @@ def backup_data(backup_name: Optional[str] = None):
             "files_backed_up": [
                 "accounts",
                 "reports", 
-                "sync_state"
+                "sync_state",
+                "history"
             ]
         }
         
@@ -328,6 +610,30 @@ def backup_data(backup_name: Optional[str] = None):
     except Exception as e:
         raise FileOperationError(f"Failed to create backup: {e}")
 
+def _restore_directory(source: Path, target: Path, copy_function=_link_or_copy):
+    """
+    Replace target with the contents of source. The copy is staged next to
+    target (hard-linked where possible, so the backup itself stays intact) and
+    swapped in with renames, so target is never left half-restored.
+    """
+    suffix = f"{os.getpid()}.{time.time_ns()}"
+    staging = target.with_name(f".{target.name}.restore.{suffix}")
+    old = target.with_name(f".{target.name}.old.{suffix}")
+    
+    shutil.copytree(source, staging, copy_function=copy_function)
+    try:
+        if target.exists():
+            os.replace(target, old)
+        os.replace(staging, target)
+    except Exception:
+        # Put the original back if the swap did not complete
+        if old.exists() and not target.exists():
+            os.replace(old, target)
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    
+    shutil.rmtree(old, ignore_errors=True)
+
 def restore_data(backup_name: str):
     """Restore data from a backup"""
     backup_dir = Path(f"data/backups/{backup_name}")
@@ -342,20 +648,15 @@ def restore_data(backup_name: str):
             manifest = load_json_file(manifest_file)
             # Could add version checking here
         
-        # Restore account configs
-        if (backup_dir / "accounts").exists():
-            shutil.rmtree("data/accounts", ignore_errors=True)
-            shutil.copytree(backup_dir / "accounts", "data/accounts")
-        
-        # Restore reports
-        if (backup_dir / "reports").exists():
-            shutil.rmtree("data/reports", ignore_errors=True)
-            shutil.copytree(backup_dir / "reports", "data/reports")
+        # Restore account configs, reports, sync state and balance history
+        for name in ("accounts", "reports", "sync_state", "history"):
+            if (backup_dir / name).exists():
+                # Files changed in place must not share inodes with the backup
+                copy_function = shutil.copy2 if name in _COPIED_BACKUP_DIRS else _link_or_copy
+                _restore_directory(backup_dir / name, Path("data") / name, copy_function)
         
-        # Restore sync state
-        if (backup_dir / "sync_state").exists():
-            shutil.rmtree("data/sync_state", ignore_errors=True)
-            shutil.copytree(backup_dir / "sync_state", "data/sync_state")
+        # Force the next load_account_configs to re-read the restored files
+        _accounts_cache['key'] = None
             
     except Exception as e:
         raise FileOperationError(f"Failed to restore backup {backup_name}: {e}")
@@ -384,11 +685,11 @@ def validate_account_config(config_data: Dict[str, Any]) -> List[str]:
     """Validate account configuration data"""
     errors = []
     
-    required_fields = ['nickname', 'api_key', 'api_secret', 'url', 'account_type', 'role']
-    for field in required_fields:
-        if field not in config_data:
-            errors.append(f"Missing required field: {field}")
-        elif not config_data[field]:
+    missing = _REQUIRED_ACCOUNT_FIELDS - config_data.keys()
+    for field in sorted(missing):
+        errors.append(f"Missing required field: {field}")
+    for field in sorted(_REQUIRED_ACCOUNT_FIELDS - missing):
+        if not config_data[field]:
             errors.append(f"Empty value for required field: {field}")
     
     # Validate account_type
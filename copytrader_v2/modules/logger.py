@@ -2,117 +2,445 @@
 Copytrader v2 - Advanced Logging System
 Comprehensive logging with structured output, file rotation, and error tracking
 """
+import atexit
+import io
 import logging
 import logging.handlers
 import os
+import queue
+import struct
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Optional, Any
+from collections import deque
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import json
-from datetime import datetime, timezone
-import traceback
+from datetime import datetime
 
 from .exceptions import FileOperationError, create_error_context
+# Entry building and field merging live in a separate, fully typed module so
+# they can be compiled with mypyc; an uncompiled checkout imports the same code
+from ._logger_fast import build_entry as _build_entry, merge_extra as _merge_extra
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Log file name suffix per output format ('msgpack' files are binary)
+LOG_SUFFIXES = {'json': '.log', 'text': '.log', 'msgpack': '.msgpack'}
+
+# Length prefix of each MessagePack log record
+_FRAME_HEADER = struct.Struct('<I')
+
+# Names used on every log call, resolved once at import instead of through
+# module attribute lookups per record
+_LogRecord = logging.LogRecord
+_json_dumps = json.dumps
+if ORJSON_AVAILABLE:
+    _orjson_dumps = orjson.dumps
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+def _dumps(log_entry: Dict[str, Any]) -> str:
+    """Serialize a log entry to a JSON string; unknown types (Decimal, ...) fall back to str()"""
+    if ORJSON_AVAILABLE:
+        return _orjson_dumps(log_entry, default=str, option=_ORJSON_OPTIONS).decode()
+    return _json_dumps(log_entry, ensure_ascii=False, default=str)
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging"""
     
-    def format(self, record: logging.LogRecord) -> str:
-        # Create base log entry
-        log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
-            'level': record.levelname,
-            'logger': record.name,
-            'message': record.getMessage(),
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno
-        }
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, ISO prefix) of the last formatted record; records arrive
+        # in bursts within the same second, so strftime runs about once a second
+        self._second_prefix = (None, '')
+        
+        # format() and format_bytes() are closures built once per formatter with
+        # the serializer, its options and the bound helpers resolved up front
+        self.format, self.format_bytes = self._specialize()
+    
+    def _iso_timestamp(self, created: float) -> str:
+        """UTC ISO 8601 timestamp with microseconds, without building a datetime"""
+        second = int(created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+            self._second_prefix = (second, prefix)
+        micros = min(round((created - second) * 1_000_000), 999_999)
+        return f"{prefix}.{micros:06d}+00:00"
+    
+    def _specialize(self) -> Tuple[Callable[[logging.LogRecord], str], Callable[[logging.LogRecord], bytes]]:
+        """
+        Build this formatter's format (JSON str) and format_bytes (one encoded
+        JSON line, newline included) functions
+        """
+        build_entry = _build_entry
+        iso_timestamp = self._iso_timestamp
+        
+        if ORJSON_AVAILABLE:
+            dumps, options = _orjson_dumps, _ORJSON_OPTIONS
+            
+            def format_bytes(record: logging.LogRecord) -> bytes:
+                return dumps(build_entry(record, iso_timestamp(record.created)), default=str, option=options) + b'\n'
+            
+            def format(record: logging.LogRecord) -> str:
+                return dumps(build_entry(record, iso_timestamp(record.created)), default=str, option=options).decode()
+        else:
+            dumps = _json_dumps
+            
+            def format(record: logging.LogRecord) -> str:
+                return dumps(build_entry(record, iso_timestamp(record.created)), ensure_ascii=False, default=str)
+            
+            def format_bytes(record: logging.LogRecord) -> bytes:
+                return (format(record) + '\n').encode('utf-8')
         
-        # Add exception info if present
-        if record.exc_info:
-            log_entry['exception'] = {
-                'type': record.exc_info[0].__name__ if record.exc_info[0] else None,
-                'message': str(record.exc_info[1]) if record.exc_info[1] else None,
-                'traceback': traceback.format_exception(*record.exc_info)
-            }
+        return format, format_bytes
+
+class MsgpackFormatter(StructuredFormatter):
+    """
+    Binary variant of StructuredFormatter for machine-read logs
+    Each record is one MessagePack map prefixed with its length (uint32 LE)
+    """
+    
+    def _specialize(self) -> Tuple[Callable[[logging.LogRecord], str], Callable[[logging.LogRecord], bytes]]:
+        """Keep the JSON format(); format_bytes() returns one length-prefixed MessagePack frame"""
+        format, _ = super()._specialize()
+        build_entry = _build_entry
+        iso_timestamp = self._iso_timestamp
+        packb = msgpack.packb
+        pack_header = _FRAME_HEADER.pack
+        
+        def format_bytes(record: logging.LogRecord) -> bytes:
+            buf = packb(build_entry(record, iso_timestamp(record.created)), use_bin_type=True, default=str)
+            return pack_header(len(buf)) + buf
         
-        # Add extra fields if present
-        if hasattr(record, 'extra_fields'):
-            log_entry.update(record.extra_fields)
+        return format, format_bytes
+
+# Shared formatter instances; formatters keep no per-handler state, and every
+# file handler formats on the single writer thread
+_TEXT_FMT = logging.Formatter(
+    '%(asctime)s | %(name)-12s | %(levelname)-8s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_STRUCT_FMT = StructuredFormatter()
+_MSGPACK_FMT = MsgpackFormatter() if MSGPACK_AVAILABLE else None
+
+class SizeTrackingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that keeps a running byte count for the rollover check
+    The stock shouldRollover() stats the file and re-formats the record on every emit
+    Text records are counted in characters, which is exact for ASCII log lines
+    """
+    
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        return self.maxBytes > 0 and self._bytes_written >= self.maxBytes
+    
+    def _rollover_before(self, size: int):
+        """Roll over if writing size more bytes would reach maxBytes (never for an empty file)"""
+        if self.maxBytes > 0 and self._bytes_written > 0 and self._bytes_written + size >= self.maxBytes:
+            self.doRollover()
+    
+    def doRollover(self):
+        super().doRollover()
+        self._bytes_written = 0
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            self._rollover_before(len(msg))
+            self.stream.write(msg)
+            self.stream.flush()
+            self._bytes_written += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class RawBytesRotatingHandler(SizeTrackingRotatingFileHandler):
+    """
+    Rotating file handler for StructuredFormatter output
+    Writes format_bytes() straight to a binary stream, skipping the str -> UTF-8
+    round trip of the stock handler
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, 'ab', buffering=io.DEFAULT_BUFFER_SIZE)
+    
+    def _write(self, data: bytes):
+        if self.stream is None:
+            self.stream = self._open()
+        self._rollover_before(len(data))
+        self.stream.write(data)
+        self.stream.flush()
+        self._bytes_written += len(data)
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._write(self.formatter.format_bytes(record))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def emit_batch(self, records: List[logging.LogRecord]):
+        """Write several records with one write and one rollover check"""
+        chunks = []
+        for record in records:
+            if record.levelno < self.level:
+                continue
+            try:
+                chunks.append(self.formatter.format_bytes(record))
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+        if not chunks:
+            return
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        self.acquire()
+        try:
+            self._write(b''.join(chunks))
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+class _BatchingLogWriter(threading.Thread):
+    """
+    Background writer for queued module log records
+    Collects up to batch_max records (or whatever arrives within flush_interval
+    of the first one), routes them to their logger's file handler and writes
+    each handler's share in one go
+    """
+    
+    _SENTINEL = None
+    
+    def __init__(
+        self,
+        record_queue: queue.SimpleQueue,
+        handlers: Dict[str, logging.Handler],
+        batch_max: int,
+        flush_interval: float
+    ):
+        super().__init__(name="copytrader-log-writer", daemon=True)
+        self._queue = record_queue
+        self._handlers = handlers
+        self._routes: Dict[str, Optional[logging.Handler]] = {}
+        self.batch_max = batch_max
+        self.flush_interval = flush_interval
+    
+    def _route(self, logger_name: str) -> Optional[logging.Handler]:
+        """Handler for a logger name, falling back to its dotted parents (telegram.ext -> telegram)"""
+        handler = self._routes.get(logger_name, False)
+        if handler is False:
+            name = logger_name
+            handler = self._handlers.get(name)
+            while handler is None and '.' in name:
+                name = name.rsplit('.', 1)[0]
+                handler = self._handlers.get(name)
+            self._routes[logger_name] = handler
+        return handler
+    
+    def run(self):
+        get = self._queue.get
+        running = True
+        while running:
+            record = get()
+            if record is self._SENTINEL:
+                break
+            
+            batch = [record]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_max:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    record = get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if record is self._SENTINEL:
+                    running = False
+                    break
+                batch.append(record)
+            
+            self._write(batch)
+    
+    def _write(self, batch: List[logging.LogRecord]):
+        """Group a batch by destination handler and write each group"""
+        groups: Dict[logging.Handler, List[logging.LogRecord]] = {}
+        for record in batch:
+            handler = self._route(record.name)
+            if handler is not None:
+                groups.setdefault(handler, []).append(record)
+        
+        for handler, records in groups.items():
+            if isinstance(handler, RawBytesRotatingHandler):
+                handler.emit_batch(records)
+            else:
+                for record in records:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+    
+    def stop(self):
+        """Flush everything queued so far and end the thread"""
+        self._queue.put(self._SENTINEL)
+        self.join()
+
+def _level_method(level: int, name: str, accepts_exc_info: bool = False):
+    """Build a CopytraderLogger level method that closes over its level constant"""
+    if accepts_exc_info:
+        def method(self, message: str, extra: Optional[Dict[str, Any]] = None, exc_info: bool = False, **kwargs):
+            # Only the exc_info tuple is captured here; the formatter renders the
+            # traceback when (and if) the record is written
+            exc = sys.exc_info() if exc_info else None
+            if exc is not None and exc[0] is None:
+                exc = None  # exc_info=True outside an except block
+            self._log_with_context(level, message, extra, exc, **kwargs)
+    else:
+        def method(self, message: str, extra: Optional[Dict[str, Any]] = None, **kwargs):
+            self._log_with_context(level, message, extra, **kwargs)
+    
+    method.__name__ = name
+    method.__qualname__ = f"CopytraderLogger.{name}"
+    method.__doc__ = f"Log {name} message with context"
+    return method
 
 class CopytraderLogger:
     """Enhanced logger with context and structured output"""
     
+    __slots__ = ('logger', 'name', 'context', '_is_enabled_for', '_handle')
+    
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
         self.name = name
         self.context = {}
+        
+        # Bound once instead of looked up through self.logger on every call
+        self._is_enabled_for = self.logger.isEnabledFor
+        self._handle = self.logger.handle
     
     def set_context(self, **kwargs):
         """Set persistent context for this logger"""
-        self.context.update(kwargs)
+        # Copy-on-write: records may share the context dict, so it is never mutated
+        self.context = {**self.context, **kwargs}
     
     def clear_context(self):
         """Clear persistent context"""
-        self.context.clear()
+        self.context = {}
     
-    def _log_with_context(self, level: int, message: str, extra: Optional[Dict[str, Any]] = None, **kwargs):
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a record at this level would be handled (cached by logging)"""
+        return self._is_enabled_for(level)
+    
+    def _log_with_context(
+        self,
+        level: int,
+        message: str,
+        extra: Optional[Dict[str, Any]] = None,
+        _exc_info: Optional[tuple] = None,
+        **kwargs
+    ):
         """Log with context and extra fields"""
-        combined_extra = dict(self.context)
-        if extra:
-            combined_extra.update(extra)
-        combined_extra.update(kwargs)
+        # Skip building the record entirely when this level is filtered out
+        if not self._is_enabled_for(level):
+            return
         
-        # Create a LogRecord with extra fields
-        record = self.logger.makeRecord(
-            self.logger.name, level, "", 0, message, (), None
-        )
+        combined_extra = _merge_extra(self.context, extra, kwargs)
+        
+        # Create a LogRecord with extra fields directly; Logger.makeRecord only
+        # adds a factory indirection and an `extra` merge we do not use
+        record = _LogRecord(self.name, level, "", 0, message, (), _exc_info)
         record.extra_fields = combined_extra
         
-        self.logger.handle(record)
-    
-    def debug(self, message: str, extra: Optional[Dict[str, Any]] = None, **kwargs):
-        """Log debug message with context"""
-        self._log_with_context(logging.DEBUG, message, extra, **kwargs)
-    
-    def info(self, message: str, extra: Optional[Dict[str, Any]] = None, **kwargs):
-        """Log info message with context"""
-        self._log_with_context(logging.INFO, message, extra, **kwargs)
-    
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None, **kwargs):
-        """Log warning message with context"""
-        self._log_with_context(logging.WARNING, message, extra, **kwargs)
-    
-    def error(self, message: str, extra: Optional[Dict[str, Any]] = None, exc_info: bool = False, **kwargs):
-        """Log error message with context"""
-        if exc_info:
-            kwargs['exception_info'] = traceback.format_exc()
-        self._log_with_context(logging.ERROR, message, extra, **kwargs)
-    
-    def critical(self, message: str, extra: Optional[Dict[str, Any]] = None, exc_info: bool = False, **kwargs):
-        """Log critical message with context"""
-        if exc_info:
-            kwargs['exception_info'] = traceback.format_exc()
-        self._log_with_context(logging.CRITICAL, message, extra, **kwargs)
+        self._handle(record)
+    
+    # Level methods are generated with their level baked in (see _level_method)
+    debug = _level_method(logging.DEBUG, 'debug')
+    info = _level_method(logging.INFO, 'info')
+    warning = _level_method(logging.WARNING, 'warning')
+    error = _level_method(logging.ERROR, 'error', accepts_exc_info=True)
+    critical = _level_method(logging.CRITICAL, 'critical', accepts_exc_info=True)
+
+def _unknown_caller(*args, **kwargs):
+    """
+    findCaller replacement for the module loggers: plain logging calls on them
+    skip the stack frame walk and get the stdlib's "unknown caller" values
+    (CopytraderLogger builds its records without caller info anyway)
+    """
+    return "(unknown file)", 0, "(unknown function)", None
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that hands records over as-is (the stock prepare() pre-formats
+    them to text and drops exc_info, which the structured formatter needs)
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge %-args now so formatting on the writer thread cannot see later mutations
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
 
 class LoggingManager:
     """Manages all logging configuration and file handlers"""
     
-    def __init__(self, log_dir: Path):
+    def __init__(self, log_dir: Path, batch_max: int = 256, flush_interval_ms: int = 50):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         self.handlers: Dict[str, logging.Handler] = {}
+        self.formats: Dict[str, str] = {}
         self.loggers: Dict[str, CopytraderLogger] = {}
         
+        # Module loggers only enqueue records; file formatting, writes and
+        # rotation happen in batches on the writer thread
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        
         # Configure root logger
         self._setup_root_logger()
         
         # Setup module-specific loggers
         self._setup_module_loggers()
+        
+        # Create the wrappers for every configured logger up front so lookups
+        # for them never take the creation path
+        for name in self.handlers:
+            self.loggers[name] = CopytraderLogger(name)
+        
+        self._writer: Optional[_BatchingLogWriter] = _BatchingLogWriter(
+            self._queue, self.handlers, batch_max, flush_interval_ms / 1000
+        )
+        self._writer.start()
+        atexit.register(self.shutdown)
+    
+    def shutdown(self):
+        """Drain queued records to disk and close the file handlers"""
+        if self._writer is None:
+            return
+        self._writer.stop()
+        self._writer = None
+        for handler in self.handlers.values():
+            handler.close()
     
     def _setup_root_logger(self):
         """Setup root logger configuration"""
@@ -126,56 +454,64 @@ class LoggingManager:
         # Console handler for immediate feedback
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
-            '%(asctime)s | %(name)-12s | %(levelname)-8s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(_TEXT_FMT)
         
         root_logger.addHandler(console_handler)
     
     def _setup_module_loggers(self):
         """Setup loggers for specific modules"""
+        # format: 'json' (structured), 'msgpack' (structured, binary) or 'text'
         log_configs = {
-            'main': {'level': logging.INFO, 'structured': True},
-            'api': {'level': logging.DEBUG, 'structured': True},
-            'sync': {'level': logging.INFO, 'structured': True},
-            'telegram': {'level': logging.INFO, 'structured': False},
-            'error': {'level': logging.ERROR, 'structured': True},
-            'trading': {'level': logging.INFO, 'structured': True},
-            'reporting': {'level': logging.INFO, 'structured': True},
-            'security': {'level': logging.WARNING, 'structured': True}
+            'main': {'level': logging.INFO, 'format': 'json'},
+            'api': {'level': logging.DEBUG, 'format': 'msgpack'},
+            'sync': {'level': logging.INFO, 'format': 'msgpack'},
+            'telegram': {'level': logging.INFO, 'format': 'text'},
+            'error': {'level': logging.ERROR, 'format': 'json'},
+            'trading': {'level': logging.INFO, 'format': 'json'},
+            'reporting': {'level': logging.INFO, 'format': 'json'},
+            'security': {'level': logging.WARNING, 'format': 'json'}
         }
         
         for log_name, config in log_configs.items():
-            self._create_file_logger(log_name, config['level'], config['structured'])
+            self._create_file_logger(log_name, config['level'], config['format'])
     
-    def _create_file_logger(self, name: str, level: int, structured: bool = True):
+    def _create_file_logger(self, name: str, level: int, log_format: str = 'json'):
         """Create a file logger with rotation"""
-        log_file = self.log_dir / f"{name}.log"
+        if log_format == 'msgpack' and not MSGPACK_AVAILABLE:
+            log_format = 'json'
+        self.formats[name] = log_format
+        log_file = self.log_dir / f"{name}{LOG_SUFFIXES[log_format]}"
+        structured = log_format != 'text'
         
         # Rotating file handler (10MB max, 5 backups)
-        handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        )
+        if structured:
+            handler = RawBytesRotatingHandler(
+                log_file,
+                maxBytes=10*1024*1024,  # 10MB
+                backupCount=5
+            )
+        else:
+            handler = SizeTrackingRotatingFileHandler(
+                log_file,
+                maxBytes=10*1024*1024,  # 10MB
+                backupCount=5,
+                encoding='utf-8'
+            )
         handler.setLevel(level)
         
-        # Set formatter
-        if structured:
-            handler.setFormatter(StructuredFormatter())
+        # Set formatter (shared instances, see _TEXT_FMT)
+        if log_format == 'msgpack':
+            handler.setFormatter(_MSGPACK_FMT)
+        elif structured:
+            handler.setFormatter(_STRUCT_FMT)
         else:
-            handler.setFormatter(logging.Formatter(
-                '%(asctime)s | %(name)-12s | %(levelname)-8s | %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            ))
+            handler.setFormatter(_TEXT_FMT)
         
-        # Create logger
+        # Create logger; it only enqueues, the file handler runs on the writer thread
         logger = logging.getLogger(name)
         logger.setLevel(level)
-        logger.addHandler(handler)
+        logger.findCaller = _unknown_caller
+        logger.addHandler(_RecordQueueHandler(self._queue))
         
         # Prevent propagation to avoid duplicate logs
         logger.propagate = False
@@ -184,44 +520,66 @@ class LoggingManager:
     
     def get_logger(self, name: str) -> CopytraderLogger:
         """Get or create a CopytraderLogger instance"""
-        if name not in self.loggers:
-            self.loggers[name] = CopytraderLogger(name)
-        return self.loggers[name]
+        logger = self.loggers.get(name)
+        if logger is None:
+            logger = self.loggers[name] = CopytraderLogger(name)
+        return logger
+    
+    def _log_file(self, log_name: str) -> Path:
+        """Path of a log file, with the suffix of its configured format"""
+        return self.log_dir / f"{log_name}{LOG_SUFFIXES[self.formats.get(log_name, 'text')]}"
     
     def get_log_files(self) -> Dict[str, str]:
         """Get paths to all log files"""
         log_files = {}
         for name in self.handlers.keys():
-            log_file = self.log_dir / f"{name}.log"
+            log_file = self._log_file(name)
             if log_file.exists():
                 log_files[name] = str(log_file)
         return log_files
     
     def get_log_content(self, log_name: str, max_lines: int = 100) -> Optional[str]:
-        """Get recent content from a log file"""
-        log_file = self.log_dir / f"{log_name}.log"
+        """Get recent content from a log file (MessagePack logs are returned as JSON lines)"""
+        log_file = self._log_file(log_name)
         
         if not log_file.exists():
             return None
         
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                # Return last N lines
-                return ''.join(lines[-max_lines:])
+            if self.formats.get(log_name) == 'msgpack':
+                return _read_msgpack_tail(log_file, max_lines)
+            return _read_tail(log_file, max_lines)
         except Exception as e:
             self.get_logger('error').error(f"Failed to read log file {log_name}: {e}")
             return None
     
     def clear_log(self, log_name: str) -> bool:
         """Clear a specific log file"""
-        log_file = self.log_dir / f"{log_name}.log"
+        log_file = self._log_file(log_name)
         
         try:
-            if log_file.exists():
-                log_file.write_text('', encoding='utf-8')
+            if not log_file.exists():
+                return False
+            
+            handler = self.handlers.get(log_name)
+            if handler is None:
+                os.truncate(log_file, 0)
                 return True
-            return False
+            
+            # Truncate under the handler lock so the writer thread cannot append
+            # between the flush and the truncate; the byte count restarts at zero
+            handler.acquire()
+            try:
+                if handler.stream is not None:
+                    handler.stream.flush()
+                    handler.stream.seek(0)
+                    handler.stream.truncate()
+                else:
+                    os.truncate(log_file, 0)
+                handler._bytes_written = 0
+            finally:
+                handler.release()
+            return True
         except Exception as e:
             self.get_logger('error').error(f"Failed to clear log file {log_name}: {e}")
             return False
@@ -229,34 +587,98 @@ class LoggingManager:
     def archive_logs(self) -> bool:
         """Archive old log files"""
         try:
-            from datetime import datetime
-            import shutil
-            
             archive_dir = self.log_dir / "archive" / datetime.now().strftime("%Y%m%d_%H%M%S")
             archive_dir.mkdir(parents=True, exist_ok=True)
             
-            for log_file in self.log_dir.glob("*.log"):
-                if log_file.stat().st_size > 0:  # Only archive non-empty files
-                    shutil.copy2(log_file, archive_dir / log_file.name)
-                    log_file.write_text('', encoding='utf-8')  # Clear original
+            handlers_by_file = {Path(h.baseFilename).name: h for h in self.handlers.values()}
+            
+            log_files = [
+                log_file for log_file in self.log_dir.iterdir()
+                if log_file.suffix in LOG_SUFFIXES.values() and log_file.is_file()
+            ]
+            for log_file in log_files:
+                handler = handlers_by_file.get(log_file.name)
+                if handler is None:
+                    if log_file.stat().st_size > 0:  # Only archive non-empty files
+                        os.replace(log_file, archive_dir / log_file.name)
+                    continue
+                
+                # Move the file itself (a rename, not a copy) under the handler lock
+                # so the writer thread cannot append in between; the handler
+                # reopens a fresh file on its next write
+                handler.acquire()
+                try:
+                    if log_file.stat().st_size > 0:
+                        if handler.stream is not None:
+                            handler.stream.close()
+                            handler.stream = None
+                        os.replace(log_file, archive_dir / log_file.name)
+                        handler._bytes_written = 0
+                finally:
+                    handler.release()
             
             return True
         except Exception as e:
             self.get_logger('error').error(f"Failed to archive logs: {e}")
             return False
 
+def _read_tail(log_file: Path, max_lines: int, block_size: int = 64 * 1024) -> str:
+    """
+    Return the last max_lines lines of a file, reading backwards from the end
+    in growing blocks instead of loading the whole file
+    """
+    with open(log_file, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        while True:
+            start = max(0, size - block_size) if max_lines > 0 else 0
+            f.seek(start)
+            lines = f.read(size - start).splitlines(keepends=True)
+            if start == 0 or len(lines) > max_lines:
+                break
+            block_size *= 2
+    
+    if start > 0:
+        lines = lines[1:]  # First line of the block may be cut off
+    return b''.join(lines[-max_lines:]).decode('utf-8', errors='replace')
+
+def _read_msgpack_tail(log_file: Path, max_lines: int) -> str:
+    """
+    Decode the last max_lines records of a MessagePack log into JSON lines
+    Frames are walked by their length prefix; only the kept ones are unpacked,
+    and a partially written final frame is ignored
+    """
+    data = log_file.read_bytes()
+    header_size = _FRAME_HEADER.size
+    frames = deque(maxlen=max(max_lines, 0))
+    offset = 0
+    while offset + header_size <= len(data):
+        (length,) = _FRAME_HEADER.unpack_from(data, offset)
+        start = offset + header_size
+        if start + length > len(data):
+            break
+        frames.append((start, start + length))
+        offset = start + length
+    
+    return ''.join(
+        _dumps(msgpack.unpackb(data[start:end], raw=False)) + '\n'
+        for start, end in frames
+    )
+
 # Global logging manager instance
 _logging_manager: Optional[LoggingManager] = None
+# Bound get_logger of the manager above, so get_logger() skips the attribute lookup
+_get_logger: Optional[Callable[[str], CopytraderLogger]] = None
 
 def setup_logging(log_dir: Optional[Path] = None):
     """Setup global logging configuration"""
-    global _logging_manager
+    global _logging_manager, _get_logger
     
     if log_dir is None:
         log_dir = Path("data/logs")
     
     try:
         _logging_manager = LoggingManager(log_dir)
+        _get_logger = _logging_manager.get_logger
         
         # Log startup message
         logger = get_logger('main')
@@ -268,12 +690,10 @@ def setup_logging(log_dir: Optional[Path] = None):
 
 def get_logger(name: str) -> CopytraderLogger:
     """Get a logger instance"""
-    global _logging_manager
-    
-    if _logging_manager is None:
+    if _get_logger is None:
         setup_logging()
     
-    return _logging_manager.get_logger(name)
+    return _get_logger(name)
 
 def get_log_content(log_name: str, max_lines: int = 100) -> Optional[str]:
     """Get content from a log file"""
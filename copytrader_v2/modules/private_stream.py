@@ -0,0 +1,292 @@
+"""
+Copytrader v2 - Bybit V5 Private WebSocket Stream
+Keeps an in-memory snapshot of positions and open orders so the sync loop
+does not have to poll the REST API every cycle
+"""
+import asyncio
+import aiohttp
+import hmac
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
+
+from .logger import get_logger
+
+if TYPE_CHECKING:
+    from .api_handler import BybitAPIHandler
+
+# REST host -> private stream URL
+STREAM_URLS = {
+    'api.bybit.com': 'wss://stream.bybit.com/v5/private',
+    'api.bytick.com': 'wss://stream.bybit.com/v5/private',
+    'api-testnet.bybit.com': 'wss://stream-testnet.bybit.com/v5/private',
+    'api-demo.bybit.com': 'wss://stream-demo.bybit.com/v5/private',
+}
+
+# Order statuses that keep an order in the open-orders snapshot
+ACTIVE_ORDER_STATUSES = frozenset({'New', 'PartiallyFilled', 'Untriggered'})
+
+def get_stream_url(rest_url: str) -> Optional[str]:
+    """Map a Bybit REST base URL to its private WebSocket URL"""
+    host = rest_url.split('://', 1)[-1].split('/', 1)[0]
+    return STREAM_URLS.get(host)
+
+class BybitPrivateStream:
+    """
+    Private WebSocket subscription for one account
+    Subscribes to position and order topics and applies pushes to a snapshot
+    seeded over REST; callers fall back to REST while not live
+    """
+
+    TOPICS = ['position', 'order']
+
+    # Category the snapshot is seeded for; other categories always use REST
+    SNAPSHOT_CATEGORY = 'linear'
+
+    PING_INTERVAL = 20  # Bybit drops idle connections after ~30s
+    # Without any frame (push or pong) for this long the connection is treated as dead
+    STALE_AFTER = 2 * PING_INTERVAL
+    AUTH_EXPIRES_MS = 10000
+    MAX_RECONNECT_DELAY = 60
+    # A frame gap this long ends the drain of pushes buffered while seeding
+    DRAIN_TIMEOUT = 0.2
+    # Versions of removed orders kept to reject late pushes for them
+    MAX_ORDER_VERSIONS = 1000
+
+    def __init__(self, api_handler: "BybitAPIHandler"):
+        self.api_handler = api_handler
+        self.account_config = api_handler.account_config
+        self.url = get_stream_url(self.account_config.url)
+        self.logger = get_logger('api')
+
+        self._positions: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._open_orders: Dict[str, Dict[str, Any]] = {}
+
+        # Newest (updatedTime, seq) applied per position/order, kept after
+        # removal too, so an older push cannot overwrite newer state
+        self._position_versions: Dict[Tuple[str, int], Tuple[int, int]] = {}
+        self._order_versions: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+
+        self._live = False
+        self._last_frame = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def is_live(self) -> bool:
+        """True while connected, authenticated, subscribed, seeded and still receiving frames"""
+        return self._live and time.monotonic() - self._last_frame < self.STALE_AFTER
+
+    async def start(self):
+        """Start the background connection task"""
+        if not self.url:
+            self.logger.warning(
+                "No private stream URL for host, using REST polling only",
+                url=self.account_config.url
+            )
+            return
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background task and close the connection"""
+        self._live = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    # Snapshot accessors
+
+    def get_positions(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Positions from the snapshot, optionally filtered by symbol"""
+        return [
+            position for position in self._positions.values()
+            if symbol is None or position.get('symbol') == symbol
+        ]
+
+    def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Open orders from the snapshot, optionally filtered by symbol"""
+        return [
+            order for order in self._open_orders.values()
+            if symbol is None or order.get('symbol') == symbol
+        ]
+
+    # Connection handling
+
+    async def _run(self):
+        """Connect, and reconnect with backoff, until cancelled"""
+        delay = 1
+        while True:
+            try:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession()
+
+                async with self._session.ws_connect(self.url, heartbeat=None) as ws:
+                    await self._authenticate(ws)
+                    await ws.send_str(json.dumps({'op': 'subscribe', 'args': self.TOPICS}))
+                    await self._seed_snapshot()
+                    self._last_frame = time.monotonic()
+                    # Pushes received during the REST seed are newer than or
+                    # version-checked against it; apply them before going live
+                    await self._drain(ws)
+                    self._live = True
+                    delay = 1
+                    self.logger.info("Private stream live", account=self.account_config.nickname)
+
+                    await self._consume(ws)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Private stream error: {e}", account=self.account_config.nickname)
+            finally:
+                self._live = False
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.MAX_RECONNECT_DELAY)
+
+    async def _authenticate(self, ws: aiohttp.ClientWebSocketResponse):
+        """Send the auth op and wait for its acknowledgement"""
+        expires = time.time_ns() // 1_000_000 + self.AUTH_EXPIRES_MS
+        signature = hmac.new(
+            self.account_config.api_secret.encode(),
+            f"GET/realtime{expires}".encode(),
+            hashlib.sha256
+        ).hexdigest()
+
+        await ws.send_str(json.dumps({
+            'op': 'auth',
+            'args': [self.account_config.api_key, expires, signature]
+        }))
+
+        reply = await ws.receive_json(timeout=10)
+        if not reply.get('success'):
+            raise ConnectionError(f"Private stream authentication failed: {reply.get('ret_msg')}")
+
+    async def _seed_snapshot(self):
+        """Load the starting state over REST (the stream only pushes changes)"""
+        positions = await self.api_handler.get_positions(category=self.SNAPSHOT_CATEGORY)
+        orders = await self.api_handler.get_open_orders(category=self.SNAPSHOT_CATEGORY)
+
+        self._positions.clear()
+        self._open_orders.clear()
+        self._position_versions.clear()
+        self._order_versions.clear()
+        self._apply_positions(positions)
+        self._apply_orders(orders)
+
+    async def _consume(self, ws: aiohttp.ClientWebSocketResponse):
+        """Read pushes until the connection closes or goes silent, pinging in between"""
+        while True:
+            try:
+                msg = await ws.receive(timeout=self.PING_INTERVAL)
+            except asyncio.TimeoutError:
+                # A half-open connection never errors; it just stops delivering frames
+                if time.monotonic() - self._last_frame >= self.STALE_AFTER:
+                    raise ConnectionError(f"No frames for {self.STALE_AFTER}s (pong missed)")
+                await ws.send_str(json.dumps({'op': 'ping'}))
+                continue
+
+            if not self._handle_frame(msg):
+                return
+
+    async def _drain(self, ws: aiohttp.ClientWebSocketResponse):
+        """Apply the frames already buffered, until none arrives for DRAIN_TIMEOUT"""
+        while True:
+            try:
+                msg = await ws.receive(timeout=self.DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                return
+            if not self._handle_frame(msg):
+                raise ConnectionError("Private stream closed while seeding")
+
+    def _handle_frame(self, msg: aiohttp.WSMessage) -> bool:
+        """Apply one received frame; False once the connection is closed"""
+        self._last_frame = time.monotonic()
+        if msg.type != aiohttp.WSMsgType.TEXT:
+            return msg.type not in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR)
+
+        self._handle_message(json.loads(msg.data))
+        return True
+
+    def _handle_message(self, message: Dict[str, Any]):
+        """Apply one push message to the snapshot"""
+        topic = message.get('topic')
+        data = message.get('data') or []
+
+        if topic == 'position':
+            self._apply_positions(data)
+        elif topic == 'order':
+            self._apply_orders(data)
+
+    @staticmethod
+    def _version(item: Dict[str, Any]) -> Tuple[int, int]:
+        """Ordering key of a position/order update: (updatedTime ms, seq)"""
+        try:
+            updated = int(item.get('updatedTime') or 0)
+        except (TypeError, ValueError):
+            updated = 0
+        try:
+            seq = int(item.get('seq') if item.get('seq') is not None else -1)
+        except (TypeError, ValueError):
+            seq = -1
+        return updated, seq
+
+    def _apply_positions(self, positions: List[Dict[str, Any]]):
+        """Upsert positions; closed (size 0) positions are removed"""
+        for position in positions:
+            if position.get('category', self.SNAPSHOT_CATEGORY) != self.SNAPSHOT_CATEGORY:
+                continue
+
+            # The stream reports entryPrice where REST reports avgPrice
+            if 'avgPrice' not in position and 'entryPrice' in position:
+                position['avgPrice'] = position['entryPrice']
+
+            key = (position.get('symbol', ''), int(position.get('positionIdx', 0)))
+            version = self._version(position)
+            if version < self._position_versions.get(key, (0, -1)):
+                continue  # Older than what the snapshot already holds
+            self._position_versions[key] = version
+
+            if float(position.get('size') or 0) > 0:
+                self._positions[key] = position
+            else:
+                self._positions.pop(key, None)
+
+    def _apply_orders(self, orders: List[Dict[str, Any]]):
+        """Upsert active orders; filled/cancelled orders are removed"""
+        for order in orders:
+            if order.get('category', self.SNAPSHOT_CATEGORY) != self.SNAPSHOT_CATEGORY:
+                continue
+
+            order_id = order.get('orderId')
+            if not order_id:
+                continue
+
+            version = self._version(order)
+            if version < self._order_versions.get(order_id, (0, -1)):
+                continue  # Older than what the snapshot already holds
+            self._order_versions[order_id] = version
+            self._order_versions.move_to_end(order_id)
+            if len(self._order_versions) > self.MAX_ORDER_VERSIONS:
+                # Forget the oldest version that no longer belongs to an open order
+                for old_id in self._order_versions:
+                    if old_id not in self._open_orders and old_id != order_id:
+                        del self._order_versions[old_id]
+                        break
+
+            if order.get('orderStatus') in ACTIVE_ORDER_STATUSES:
+                self._open_orders[order_id] = order
+            else:
+                self._open_orders.pop(order_id, None)
@@ -3,10 +3,19 @@ Copytrader v2 - Reporting Manager
 Comprehensive reporting and analytics system with chart generation
 """
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
+import hashlib
 import json
+import shutil
+import statistics
+import subprocess
+import threading
 from pathlib import Path
 
 from .exceptions import (
@@ -20,20 +29,180 @@ from .file_utils import (
     load_json_file,
     save_json_file,
     save_balance_history,
+    save_balance_history_append,
     load_balance_history,
+    load_balance_history_tail,
+    get_balance_history_file,
+    get_balance_history_version,
+    save_balance_history_parquet,
+    load_balance_history_parquet,
+    PYARROW_AVAILABLE,
     save_pnl_summary,
     load_pnl_summary
 )
 
 try:
-    import matplotlib.pyplot as plt
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from ._metrics_numba import compute_metrics as _compute_metrics_numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
     import matplotlib.dates as mdates
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import to_rgba
     from matplotlib.figure import Figure
-    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
+# Layout written by datetime.now(timezone.utc).isoformat(): YYYY-MM-DDTHH:MM:SS.ffffff+00:00
+_UTC_SUFFIX = '+00:00'
+_UTC_ISO_LENGTH = 32
+
+def _content_digest(data: Any) -> str:
+    """Short hash of a JSON-serializable value, independent of key order"""
+    payload = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh64(payload).hexdigest()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+def _parse_iso_utc_fast(text: str) -> datetime:
+    """
+    Naive UTC datetime of an ISO 8601 string
+    The fixed layout written by update_balance_history is sliced directly;
+    anything else goes through fromisoformat. Raises ValueError if invalid
+    """
+    if len(text) == _UTC_ISO_LENGTH and text.endswith(_UTC_SUFFIX) and text[10] == 'T':
+        return datetime(
+            int(text[0:4]), int(text[5:7]), int(text[8:10]),
+            int(text[11:13]), int(text[14:16]), int(text[17:19]), int(text[20:26])
+        )
+    
+    timestamp = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+def _parse_timestamp(entry: Dict) -> Optional[datetime]:
+    """Naive UTC datetime of a history entry, None if missing or invalid"""
+    try:
+        return _parse_iso_utc_fast(entry['timestamp'])
+    except (ValueError, KeyError, AttributeError, TypeError):
+        return None
+
+def _balances_array(balance_history: List[Dict]) -> "np.ndarray":
+    """Balances of a history as a float64 array"""
+    return np.fromiter(
+        (float(entry.get('balance', 0)) for entry in balance_history),
+        dtype=np.float64,
+        count=len(balance_history)
+    )
+
+def _to_arrays(balance_history: List[Dict]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Parse a balance history once into parallel arrays: timestamps as
+    datetime64[us] (NaT for unparseable entries) and balances as float64
+    """
+    # Fixed-layout UTC strings are parsed by numpy in C once the offset is
+    # sliced off; other entries are normalized in Python first
+    texts = []
+    for entry in balance_history:
+        text = entry.get('timestamp')
+        if isinstance(text, str) and len(text) == _UTC_ISO_LENGTH and text.endswith(_UTC_SUFFIX):
+            texts.append(text[:26])
+        else:
+            timestamp = _parse_timestamp(entry)
+            texts.append(timestamp.isoformat() if timestamp is not None else 'NaT')
+    
+    try:
+        timestamps = np.array(texts, dtype='datetime64[us]')
+    except ValueError:
+        # A malformed fixed-length string; parse entry by entry instead
+        timestamps = np.array(
+            [_parse_timestamp(entry) for entry in balance_history],
+            dtype='datetime64[us]'
+        )
+    return timestamps, _balances_array(balance_history)
+
+def _lttb(x: "np.ndarray", y: "np.ndarray", threshold: int) -> "np.ndarray":
+    """
+    Largest-Triangle-Three-Buckets downsampling: indices of at most threshold
+    points that keep the visual shape of the (x, y) line
+    The first and last points are always kept; from each bucket in between the
+    point forming the largest triangle with the previously kept point and the
+    next bucket's average is chosen
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    
+    # threshold - 2 buckets between the fixed first and last point
+    edges = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+    
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    return indices
+
+def _entries_since(history: List[Dict], cutoff: datetime) -> List[Dict]:
+    """Entries timestamped after an aware cutoff; entries without a valid timestamp are dropped"""
+    if PANDAS_AVAILABLE:
+        # One vectorized ISO 8601 parse instead of fromisoformat per entry
+        timestamps = pd.to_datetime(
+            [entry.get('timestamp') for entry in history],
+            utc=True, format='ISO8601', errors='coerce'
+        )
+        keep = timestamps > pd.Timestamp(cutoff)
+        return [entry for entry, kept in zip(history, keep) if kept]
+    
+    cutoff = cutoff.astimezone(timezone.utc).replace(tzinfo=None)
+    kept = []
+    for entry in history:
+        timestamp = _parse_timestamp(entry)
+        if timestamp is not None and timestamp > cutoff:
+            kept.append(entry)
+    return kept
+
 class PerformanceMetrics:
     """Performance calculation utilities"""
     
@@ -45,8 +214,11 @@ class PerformanceMetrics:
         return ((current_balance - initial_balance) / initial_balance) * 100
     
     @staticmethod
-    def calculate_daily_pnl(balance_history: List[Dict]) -> List[float]:
-        """Calculate daily PnL from balance history"""
+    def calculate_daily_pnl(balance_history: List[Dict]) -> Sequence[float]:
+        """Calculate daily PnL from balance history (a float64 array when numpy is available)"""
+        if NUMPY_AVAILABLE:
+            return np.diff(_balances_array(balance_history))
+        
         if len(balance_history) < 2:
             return []
         
@@ -65,6 +237,9 @@ class PerformanceMetrics:
         if not balance_history:
             return 0.0, 0.0
         
+        if NUMPY_AVAILABLE:
+            return PerformanceMetrics._max_drawdown_arr(_balances_array(balance_history))
+        
         balances = [float(entry.get('balance', 0)) for entry in balance_history]
         peak = balances[0]
         max_drawdown_pct = 0.0
@@ -84,16 +259,66 @@ class PerformanceMetrics:
         return max_drawdown_pct, max_drawdown_amount
     
     @staticmethod
-    def calculate_sharpe_ratio(daily_returns: List[float], risk_free_rate: float = 0.02) -> float:
+    def _max_drawdown_arr(balances: "np.ndarray") -> Tuple[float, float]:
+        """Maximum drawdown percentage and amount of a non-empty float64 balance array"""
+        peaks = np.maximum.accumulate(balances)
+        drawdown_amounts = peaks - balances
+        drawdown_pcts = np.divide(
+            drawdown_amounts * 100, peaks,
+            out=np.zeros_like(balances),
+            where=peaks > 0
+        )
+        # argmax takes the first maximum, like the strict > in calculate_max_drawdown
+        i = int(np.argmax(drawdown_pcts))
+        if drawdown_pcts[i] <= 0:
+            return 0.0, 0.0
+        return float(drawdown_pcts[i]), float(drawdown_amounts[i])
+    
+    @staticmethod
+    def compute_metrics(balances: "np.ndarray", risk_free_rate: float = 0.02) -> Tuple[float, float, float, float, int]:
+        """
+        Drawdown, Sharpe and daily PnL statistics of a non-empty float64 balance array:
+        (max drawdown %, max drawdown amount, Sharpe ratio, average daily PnL, profitable days)
+        Uses the compiled single-pass kernel when numba is installed
+        """
+        if NUMBA_AVAILABLE:
+            max_drawdown_pct, max_drawdown_amount, sharpe_ratio, avg_daily_pnl, profitable_days = \
+                _compute_metrics_numba(balances, risk_free_rate / 365)
+            return (float(max_drawdown_pct), float(max_drawdown_amount), float(sharpe_ratio),
+                    float(avg_daily_pnl), int(profitable_days))
+        
+        max_drawdown_pct, max_drawdown_amount = PerformanceMetrics._max_drawdown_arr(balances)
+        daily_pnl = np.diff(balances)
+        if not len(daily_pnl):
+            return max_drawdown_pct, max_drawdown_amount, 0.0, 0.0, 0
+        return (
+            max_drawdown_pct,
+            max_drawdown_amount,
+            PerformanceMetrics.calculate_sharpe_ratio(daily_pnl, risk_free_rate),
+            float(daily_pnl.mean()),
+            int(np.count_nonzero(daily_pnl > 0))
+        )
+    
+    @staticmethod
+    def calculate_sharpe_ratio(daily_returns: Sequence[float], risk_free_rate: float = 0.02) -> float:
         """Calculate Sharpe ratio"""
-        if not daily_returns or len(daily_returns) < 2:
+        if len(daily_returns) < 2:
             return 0.0
         
-        import statistics
-        
         # Convert annual risk-free rate to daily
         daily_rf_rate = risk_free_rate / 365
         
+        if NUMPY_AVAILABLE:
+            excess = np.asarray(daily_returns, dtype=np.float64) - daily_rf_rate
+            # A constant series has zero deviation; check exactly, since the
+            # float mean can leave a tiny non-zero std behind
+            if excess.max() == excess.min():
+                return 0.0
+            std_excess_return = excess.std(ddof=1)
+            if std_excess_return == 0:
+                return 0.0
+            return float(excess.mean() / std_excess_return * (365 ** 0.5))
+        
         excess_returns = [r - daily_rf_rate for r in daily_returns]
         
         if len(excess_returns) < 2:
@@ -120,12 +345,88 @@ class PerformanceMetrics:
 class ChartGenerator:
     """Chart generation for performance visualization"""
     
+    # Charts are viewed on screen (Telegram), where 100 DPI is full size
+    DPI = 100
+    # Fast zlib level for the PNG encode, which dominates save time
+    PNG_OPTIONS = {'compress_level': 1}
+    # Lines are downsampled (LTTB) to this many points, about what a 12" wide
+    # chart at DPI can show; daily bars are summed per week past MAX_DAILY_BARS
+    MAX_LINE_POINTS = 2000
+    MAX_DAILY_BARS = 365
+    
+    # Shared axes styling, passed as keyword arguments
+    TITLE_STYLE = {'fontsize': 14, 'fontweight': 'bold'}
+    GRID_STYLE = {'alpha': 0.3}
+    ZERO_LINE_STYLE = {'y': 0, 'color': 'black', 'linestyle': '-', 'alpha': 0.3}
+    
+    if MATPLOTLIB_AVAILABLE:
+        # RGBA fills for the PnL chart's collections
+        _BAR_UP_COLOR = to_rgba('green', 0.7)
+        _BAR_DOWN_COLOR = to_rgba('red', 0.7)
+        _FILL_COLOR = to_rgba('blue', 0.3)
+    
     def __init__(self):
         self.logger = get_logger('reporting')
+        # Figures are drawn on the Agg canvas directly (no pyplot state) and
+        # reused per thread, so a chart only clears and redraws its axes
+        self._local = threading.local()
+        
+        # Optional lossless PNG optimizer, run in the background after each save
+        self._oxipng = shutil.which('oxipng')
         
         if not MATPLOTLIB_AVAILABLE:
             self.logger.warning("Matplotlib not available - charts will not be generated")
     
+    def _get_figure(self, kind: str, nrows: int, figsize: Tuple[float, float]) -> Tuple["Figure", List[Any]]:
+        """This thread's figure and axes for a chart kind, cleared for redrawing"""
+        figures = getattr(self._local, 'figures', None)
+        if figures is None:
+            figures = self._local.figures = {}
+        
+        cached = figures.get(kind)
+        if cached is None:
+            # Constrained layout is solved during the save's draw, replacing
+            # the extra layout pass tight_layout() made before every save
+            fig = Figure(figsize=figsize, dpi=self.DPI, constrained_layout=True)
+            FigureCanvasAgg(fig)
+            axes = [fig.add_subplot(nrows, 1, i + 1) for i in range(nrows)]
+            cached = figures[kind] = (fig, axes)
+        else:
+            for ax in cached[1]:
+                ax.clear()
+        return cached
+    
+    def _optimize_png(self, output_path: str):
+        """
+        Shrink a saved chart with oxipng, if installed, without blocking the caller
+        Charts are saved with fast zlib compression (compress_level 1), which is
+        quick but leaves files 10-30% larger; oxipng recompresses them losslessly
+        on a background thread and the result replaces the file atomically, so
+        readers see either the original or the optimized PNG
+        """
+        if not self._oxipng:
+            return
+        threading.Thread(
+            target=self._run_oxipng, args=(output_path,),
+            name="copytrader-oxipng", daemon=True
+        ).start()
+    
+    def _run_oxipng(self, output_path: str):
+        """Run oxipng into a temporary file and swap it in on success"""
+        tmp_path = f"{output_path}.{time.time_ns()}.oxipng.tmp"
+        try:
+            result = subprocess.run(
+                [self._oxipng, '-o', '1', '--strip', 'safe', '--out', tmp_path, output_path],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60
+            )
+            if result.returncode == 0 and os.path.exists(tmp_path):
+                os.replace(tmp_path, output_path)
+        except (OSError, subprocess.SubprocessError) as e:
+            self.logger.debug(f"PNG optimization skipped for {output_path}: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    
     def generate_balance_chart(
         self, 
         balance_history: List[Dict], 
@@ -136,45 +437,57 @@ class ChartGenerator:
         if not MATPLOTLIB_AVAILABLE:
             return None
         
+        if not balance_history:
+            return None
+        
         try:
-            if not balance_history:
-                return None
-            
-            # Extract data
-            dates = []
-            balances = []
-            
-            for entry in balance_history:
-                try:
-                    date = datetime.fromisoformat(entry['timestamp'].replace('Z', '+00:00'))
-                    balance = float(entry.get('balance', 0))
-                    dates.append(date)
-                    balances.append(balance)
-                except (ValueError, KeyError) as e:
-                    continue
+            timestamps, balances = _to_arrays(balance_history)
+        except (ValueError, TypeError) as e:
+            self.logger.error(f"Failed to generate balance chart: {e}", exc_info=True)
+            raise ChartGenerationError(f"Failed to generate balance chart: {e}")
+        
+        return self.generate_balance_chart_from_arrays(timestamps, balances, account_name, output_path)
+    
+    def generate_balance_chart_from_arrays(
+        self,
+        timestamps: "np.ndarray",
+        balances: "np.ndarray",
+        account_name: str,
+        output_path: Optional[str] = None
+    ) -> Optional[str]:
+        """Generate balance over time chart from parsed history arrays (see _to_arrays)"""
+        if not MATPLOTLIB_AVAILABLE:
+            return None
+        
+        try:
+            # Entries without a valid timestamp are left out
+            valid = ~np.isnat(timestamps)
+            dates = timestamps[valid]
+            balances = balances[valid]
             
-            if not dates:
+            if not len(dates):
                 return None
             
             # Create chart
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(dates, balances, linewidth=2, color='#2E8B57')
+            fig, (ax,) = self._get_figure('balance', 1, (12, 6))
+            shown = _lttb(dates.astype(np.int64), balances, self.MAX_LINE_POINTS)
+            ax.plot(dates[shown], balances[shown], linewidth=2, color='#2E8B57')
             
             # Formatting
             ax.set_title(f'Balance History - {account_name}', fontsize=16, fontweight='bold')
             ax.set_xlabel('Date', fontsize=12)
             ax.set_ylabel('Balance (USDT)', fontsize=12)
-            ax.grid(True, alpha=0.3)
+            ax.grid(True, **self.GRID_STYLE)
             
             # Format x-axis
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
             ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
-            plt.xticks(rotation=45)
+            ax.tick_params(axis='x', labelrotation=45)
             
             # Add performance metrics
             if len(balances) >= 2:
-                initial_balance = balances[0]
-                current_balance = balances[-1]
+                initial_balance = float(balances[0])
+                current_balance = float(balances[-1])
                 total_return = PerformanceMetrics.calculate_total_return(initial_balance, current_balance)
                 
                 textstr = f'Initial: ${initial_balance:,.2f}\nCurrent: ${current_balance:,.2f}\nReturn: {total_return:+.2f}%'
@@ -182,15 +495,13 @@ class ChartGenerator:
                 ax.text(0.02, 0.98, textstr, transform=ax.transAxes, fontsize=10,
                        verticalalignment='top', bbox=props)
             
-            plt.tight_layout()
-            
             # Save chart
             if output_path is None:
                 output_path = f"data/charts/{account_name}_balance_{datetime.now().strftime('%Y%m%d')}.png"
             
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.savefig(output_path, dpi=self.DPI, pil_kwargs=self.PNG_OPTIONS)
+            self._optimize_png(output_path)
             
             return output_path
             
@@ -205,54 +516,83 @@ class ChartGenerator:
         output_path: Optional[str] = None
     ) -> Optional[str]:
         """Generate daily PnL chart"""
-        if not MATPLOTLIB_AVAILABLE or not daily_pnl:
+        if not MATPLOTLIB_AVAILABLE:
+            return None
+        
+        daily_pnl = np.asarray(daily_pnl, dtype=np.float64)
+        if daily_pnl.size == 0:
             return None
         
         try:
             # Create chart
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-            
-            # Daily PnL bar chart
-            days = list(range(1, len(daily_pnl) + 1))
-            colors = ['green' if pnl >= 0 else 'red' for pnl in daily_pnl]
-            
-            ax1.bar(days, daily_pnl, color=colors, alpha=0.7)
-            ax1.set_title(f'Daily PnL - {account_name}', fontsize=14, fontweight='bold')
+            fig, (ax1, ax2) = self._get_figure('pnl', 2, (12, 8))
+            
+            days = np.arange(1, len(daily_pnl) + 1)
+            
+            # Daily PnL bar chart (weekly sums for long histories)
+            if len(daily_pnl) > self.MAX_DAILY_BARS:
+                week_starts = np.arange(0, len(daily_pnl), 7)
+                bar_days = days[week_starts]
+                bar_pnl = np.add.reduceat(daily_pnl, week_starts)
+                bar_width = 7 * 0.8
+                bar_title = f'Weekly PnL - {account_name}'
+            else:
+                bar_days, bar_pnl, bar_width = days, daily_pnl, 0.8
+                bar_title = f'Daily PnL - {account_name}'
+            
+            # All bars as one PolyCollection instead of a Rectangle patch per bar
+            left = bar_days if bar_width > 1 else bar_days - bar_width / 2
+            right = left + bar_width
+            zeros = np.zeros_like(bar_pnl)
+            bar_vertices = np.stack([
+                np.column_stack((left, zeros)),
+                np.column_stack((left, bar_pnl)),
+                np.column_stack((right, bar_pnl)),
+                np.column_stack((right, zeros)),
+            ], axis=1)
+            colors = np.where((bar_pnl >= 0)[:, None], self._BAR_UP_COLOR, self._BAR_DOWN_COLOR)
+            ax1.add_collection(PolyCollection(bar_vertices, facecolors=colors, edgecolors='none'))
+            ax1.autoscale_view()
+            ax1.set_title(bar_title, **self.TITLE_STYLE)
             ax1.set_xlabel('Day')
             ax1.set_ylabel('PnL (USDT)')
-            ax1.grid(True, alpha=0.3)
-            ax1.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+            ax1.grid(True, **self.GRID_STYLE)
+            ax1.axhline(**self.ZERO_LINE_STYLE)
             
             # Cumulative PnL line chart
             cumulative_pnl = np.cumsum(daily_pnl)
-            ax2.plot(days, cumulative_pnl, linewidth=2, color='blue')
-            ax2.fill_between(days, cumulative_pnl, alpha=0.3, color='blue')
-            ax2.set_title('Cumulative PnL', fontsize=14, fontweight='bold')
+            shown = _lttb(days, cumulative_pnl, self.MAX_LINE_POINTS)
+            ax2.plot(days[shown], cumulative_pnl[shown], linewidth=2, color='blue')
+            # The area under the line is a single polygon closed along y=0
+            fill_days = days[shown]
+            fill_outline = np.column_stack((
+                np.concatenate(([fill_days[0]], fill_days, [fill_days[-1]])),
+                np.concatenate(([0.0], cumulative_pnl[shown], [0.0]))
+            ))
+            ax2.add_collection(PolyCollection([fill_outline], facecolors=[self._FILL_COLOR], edgecolors='none'))
+            ax2.set_title('Cumulative PnL', **self.TITLE_STYLE)
             ax2.set_xlabel('Day')
             ax2.set_ylabel('Cumulative PnL (USDT)')
-            ax2.grid(True, alpha=0.3)
-            ax2.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+            ax2.grid(True, **self.GRID_STYLE)
+            ax2.axhline(**self.ZERO_LINE_STYLE)
             
             # Add statistics
-            total_pnl = sum(daily_pnl)
-            avg_daily_pnl = total_pnl / len(daily_pnl)
-            winning_days = sum(1 for pnl in daily_pnl if pnl > 0)
-            win_rate = (winning_days / len(daily_pnl)) * 100
+            total_pnl = float(daily_pnl.sum())
+            avg_daily_pnl = float(daily_pnl.mean())
+            win_rate = float((daily_pnl > 0).mean()) * 100
             
             textstr = f'Total PnL: ${total_pnl:+.2f}\nAvg Daily: ${avg_daily_pnl:+.2f}\nWin Rate: {win_rate:.1f}%'
             props = dict(boxstyle='round', facecolor='lightblue', alpha=0.8)
             ax2.text(0.02, 0.98, textstr, transform=ax2.transAxes, fontsize=10,
                     verticalalignment='top', bbox=props)
             
-            plt.tight_layout()
-            
             # Save chart
             if output_path is None:
                 output_path = f"data/charts/{account_name}_pnl_{datetime.now().strftime('%Y%m%d')}.png"
             
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.savefig(output_path, dpi=self.DPI, pil_kwargs=self.PNG_OPTIONS)
+            self._optimize_png(output_path)
             
             return output_path
             
@@ -265,11 +605,38 @@ class ReportingManager:
     Main reporting manager for generating performance reports and analytics
     """
     
+    # Balance history kept on compaction, and how often compaction runs (seconds)
+    HISTORY_RETENTION_DAYS = 90
+    COMPACTION_INTERVAL = 3600
+    
     def __init__(self):
         self.logger = get_logger('reporting')
         self.chart_generator = ChartGenerator()
         self.performance_metrics = PerformanceMetrics()
         
+        # Chart rendering and PNG encoding run here instead of on the event loop
+        self._chart_executor = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            thread_name_prefix="copytrader-charts"
+        )
+        
+        # Accounts with appended balance history, compacted about once an hour
+        self._history_accounts = set()
+        self._last_compaction: Optional[float] = None
+        
+        # Daily reports by (account, history version, date); a report is only
+        # rebuilt when the balance history changed or the day rolled over
+        self._report_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._report_cache_max = 128
+        
+        # Parsed balance history per account as (file identity, byte offset,
+        # timestamps, balances); appended lines are parsed onto the arrays
+        self._history_arrays: Dict[str, Tuple[int, int, "np.ndarray", "np.ndarray"]] = {}
+        
+        # (path, content digest) of the last portfolio summary written, so an
+        # unchanged summary is not rewritten every cycle
+        self._last_summary_hash: Optional[Tuple[str, str]] = None
+        
         # Ensure chart directory exists
         Path("data/charts").mkdir(parents=True, exist_ok=True)
     
@@ -279,37 +646,29 @@ class ReportingManager:
     
     async def shutdown(self):
         """Shutdown the reporting manager"""
+        self._chart_executor.shutdown(wait=True)
         self.logger.info("Reporting manager shutdown")
     
     async def update_balance_history(self, account_name: str, balance: float, additional_data: Optional[Dict] = None):
         """Update balance history for an account"""
         try:
-            # Load existing history
-            history = load_balance_history(account_name)
-            
-            # Create new entry
+            # Create new entry; date and hour are local time, read from one clock call
+            now_utc = datetime.now(timezone.utc)
+            now_local = now_utc.astimezone()
             entry = {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': now_utc.isoformat(),
                 'balance': balance,
-                'date': datetime.now().strftime('%Y-%m-%d'),
-                'hour': datetime.now().hour
+                'date': now_local.strftime('%Y-%m-%d'),
+                'hour': now_local.hour
             }
             
             if additional_data:
                 entry.update(additional_data)
             
-            # Add to history
-            history.append(entry)
-            
-            # Keep only last 90 days
-            cutoff_date = datetime.now() - timedelta(days=90)
-            history = [
-                h for h in history 
-                if datetime.fromisoformat(h['timestamp'].replace('Z', '+00:00')) > cutoff_date
-            ]
-            
-            # Save updated history
-            save_balance_history(account_name, history)
+            # Append to history; entries past retention are trimmed by the
+            # periodic compaction in update_all_reports
+            save_balance_history_append(account_name, entry)
+            self._history_accounts.add(account_name)
             
             self.logger.debug(f"Updated balance history for {account_name}: ${balance}")
             
@@ -317,45 +676,133 @@ class ReportingManager:
             self.logger.error(f"Failed to update balance history for {account_name}: {e}")
             raise ReportingError(f"Failed to update balance history: {e}")
     
+    def _load_history_arrays(self, account_name: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Balance history as (timestamps, balances) arrays
+        Arrays parsed earlier are extended with just the appended lines; after
+        a restart or compaction the history is read whole, from the Parquet
+        cache when it is fresh
+        """
+        cached = self._history_arrays.get(account_name)
+        if cached is not None:
+            identity, offset, timestamps, balances = cached
+            try:
+                stat = get_balance_history_file(account_name).stat()
+            except FileNotFoundError:
+                stat = None
+            
+            # Appends keep the file (inode) and only grow it; compaction replaces it
+            if stat is not None and stat.st_ino == identity and stat.st_size >= offset:
+                if stat.st_size == offset:
+                    return timestamps, balances
+                
+                entries, offset, current_identity = load_balance_history_tail(account_name, offset)
+                if current_identity == identity:
+                    if entries:
+                        new_timestamps, new_balances = _to_arrays(entries)
+                        timestamps = np.concatenate((timestamps, new_timestamps))
+                        balances = np.concatenate((balances, new_balances))
+                    self._history_arrays[account_name] = (identity, offset, timestamps, balances)
+                    return timestamps, balances
+        
+        if PYARROW_AVAILABLE:
+            parquet = load_balance_history_parquet(account_name)
+            if parquet is not None:
+                return parquet
+        
+        # Tag the cache with the version read, not whatever is on disk after parsing
+        version = get_balance_history_version(account_name)
+        if version is None:
+            load_balance_history(account_name)  # Converts a legacy JSON history
+            version = get_balance_history_version(account_name)
+        
+        entries, offset, identity = load_balance_history_tail(account_name)
+        timestamps, balances = _to_arrays(entries)
+        if identity is not None:
+            self._history_arrays[account_name] = (identity, offset, timestamps, balances)
+        
+        if PYARROW_AVAILABLE and version is not None:
+            try:
+                save_balance_history_parquet(account_name, timestamps, balances, version)
+            except FileOperationError as e:
+                self.logger.warning(f"Failed to cache balance history for {account_name}: {e}")
+        return timestamps, balances
+    
     async def generate_daily_report(self, account_name: str) -> Dict[str, Any]:
         """Generate comprehensive daily report for an account"""
         try:
+            # The history file's mtime/size tag identifies its content
+            cache_key = (
+                account_name,
+                get_balance_history_version(account_name),
+                datetime.now().strftime('%Y%m%d')
+            )
+            if cache_key in self._report_cache:
+                self._report_cache.move_to_end(cache_key)
+                return self._report_cache[cache_key]
+            
             # Load data
-            balance_history = load_balance_history(account_name)
             pnl_summary = load_pnl_summary(account_name)
             
-            if not balance_history:
-                return {"error": "No balance history available"}
+            # Parse the history once; metrics and charts all work on the arrays
+            if NUMPY_AVAILABLE:
+                timestamps, balances = self._load_history_arrays(account_name)
+                if not len(balances):
+                    return {"error": "No balance history available"}
+                daily_pnl = np.diff(balances)
+                (max_drawdown_pct, max_drawdown_amount, sharpe_ratio,
+                 avg_daily_pnl, profitable_days) = self.performance_metrics.compute_metrics(balances)
+            else:
+                balance_history = load_balance_history(account_name)
+                if not balance_history:
+                    return {"error": "No balance history available"}
+                timestamps = None
+                balances = [float(entry.get('balance', 0)) for entry in balance_history]
+                daily_pnl = self.performance_metrics.calculate_daily_pnl(balance_history)
+                max_drawdown_pct, max_drawdown_amount = self.performance_metrics.calculate_max_drawdown(balance_history)
+                sharpe_ratio = self.performance_metrics.calculate_sharpe_ratio(daily_pnl) if daily_pnl else 0
+                avg_daily_pnl = sum(daily_pnl) / len(daily_pnl) if daily_pnl else 0
+                profitable_days = sum(1 for pnl in daily_pnl if pnl > 0)
             
             # Calculate metrics
-            current_balance = float(balance_history[-1].get('balance', 0))
-            initial_balance = float(balance_history[0].get('balance', 0)) if len(balance_history) > 1 else current_balance
+            current_balance = float(balances[-1])
+            initial_balance = float(balances[0]) if len(balances) > 1 else current_balance
             
             total_return = self.performance_metrics.calculate_total_return(initial_balance, current_balance)
-            daily_pnl = self.performance_metrics.calculate_daily_pnl(balance_history)
-            max_drawdown_pct, max_drawdown_amount = self.performance_metrics.calculate_max_drawdown(balance_history)
             
             # Calculate today's PnL
             today_pnl = 0.0
-            if len(balance_history) >= 2:
-                yesterday_balance = float(balance_history[-2].get('balance', 0))
+            yesterday_balance = 0.0
+            if len(balances) >= 2:
+                yesterday_balance = float(balances[-2])
                 today_pnl = current_balance - yesterday_balance
             
-            # Generate charts
+            # Generate charts on the chart threads, both at once
             balance_chart_path = None
             pnl_chart_path = None
             
-            try:
-                balance_chart_path = self.chart_generator.generate_balance_chart(
-                    balance_history, account_name
+            loop = asyncio.get_running_loop()
+            chart_jobs = {}
+            if timestamps is not None:
+                chart_jobs['balance'] = loop.run_in_executor(
+                    self._chart_executor, self.chart_generator.generate_balance_chart_from_arrays,
+                    timestamps, balances, account_name
+                )
+            if len(daily_pnl):
+                chart_jobs['pnl'] = loop.run_in_executor(
+                    self._chart_executor, self.chart_generator.generate_pnl_chart,
+                    daily_pnl, account_name
                 )
-                
-                if daily_pnl:
-                    pnl_chart_path = self.chart_generator.generate_pnl_chart(
-                        daily_pnl, account_name
-                    )
-            except Exception as e:
-                self.logger.warning(f"Failed to generate charts: {e}")
+            
+            chart_results = dict(zip(
+                chart_jobs, await asyncio.gather(*chart_jobs.values(), return_exceptions=True)
+            ))
+            for chart, result in chart_results.items():
+                if isinstance(result, Exception):
+                    self.logger.warning(f"Failed to generate {chart} chart: {result}")
+                    chart_results[chart] = None
+            balance_chart_path = chart_results.get('balance')
+            pnl_chart_path = chart_results.get('pnl')
             
             # Create report
             report = {
@@ -371,12 +818,12 @@ class ReportingManager:
                     'total_return_pct': total_return,
                     'max_drawdown_pct': max_drawdown_pct,
                     'max_drawdown_amount': max_drawdown_amount,
-                    'sharpe_ratio': self.performance_metrics.calculate_sharpe_ratio(daily_pnl) if daily_pnl else 0
+                    'sharpe_ratio': sharpe_ratio
                 },
                 'trading': {
-                    'total_days': len(balance_history),
-                    'profitable_days': sum(1 for pnl in daily_pnl if pnl > 0) if daily_pnl else 0,
-                    'avg_daily_pnl': sum(daily_pnl) / len(daily_pnl) if daily_pnl else 0
+                    'total_days': len(balances),
+                    'profitable_days': profitable_days,
+                    'avg_daily_pnl': avg_daily_pnl
                 },
                 'charts': {
                     'balance_chart': balance_chart_path,
@@ -387,6 +834,12 @@ class ReportingManager:
             # Save report
             report_path = f"data/reports/{account_name}_daily_report_{datetime.now().strftime('%Y%m%d')}.json"
             save_json_file(report_path, report, backup=False)
+            self._update_latest_report_link(account_name, Path(report_path))
+            
+            if cache_key[1] is not None:
+                self._report_cache[cache_key] = report
+                if len(self._report_cache) > self._report_cache_max:
+                    self._report_cache.popitem(last=False)
             
             self.logger.info(f"Generated daily report for {account_name}")
             return report
@@ -402,15 +855,19 @@ class ReportingManager:
             total_balance = 0.0
             total_pnl_24h = 0.0
             
-            for account in accounts:
-                try:
-                    report = await self.generate_daily_report(account)
-                    if 'error' not in report:
-                        account_reports[account] = report
-                        total_balance += report['balance']['current']
-                        total_pnl_24h += report['balance']['change_24h']
-                except Exception as e:
-                    self.logger.error(f"Failed to generate report for {account}: {e}")
+            # Accounts are reported concurrently so their chart rendering overlaps
+            reports = await asyncio.gather(
+                *(self.generate_daily_report(account) for account in accounts),
+                return_exceptions=True
+            )
+            
+            for account, report in zip(accounts, reports):
+                if isinstance(report, Exception):
+                    self.logger.error(f"Failed to generate report for {account}: {report}")
+                elif 'error' not in report:
+                    account_reports[account] = report
+                    total_balance += report['balance']['current']
+                    total_pnl_24h += report['balance']['change_24h']
             
             summary = {
                 'generated_at': datetime.now(timezone.utc).isoformat(),
@@ -426,7 +883,13 @@ class ReportingManager:
             
             # Save summary report
             summary_path = f"data/reports/portfolio_summary_{datetime.now().strftime('%Y%m%d')}.json"
-            save_json_file(summary_path, summary, backup=False)
+            # generated_at changes every call, so it is left out of the comparison
+            summary_hash = (summary_path, _content_digest(
+                {key: value for key, value in summary.items() if key != 'generated_at'}
+            ))
+            if summary_hash != self._last_summary_hash or not os.path.exists(summary_path):
+                save_json_file(summary_path, summary, backup=False)
+                self._last_summary_hash = summary_hash
             
             self.logger.info(f"Generated summary report for {len(accounts)} accounts")
             return summary
@@ -435,20 +898,64 @@ class ReportingManager:
             self.logger.error(f"Failed to generate summary report: {e}")
             raise ReportingError(f"Failed to generate summary report: {e}")
     
+    def _compact_balance_history(self, account_name: str):
+        """Rewrite an account's balance history without entries past the retention window"""
+        history = load_balance_history(account_name)
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.HISTORY_RETENTION_DAYS)
+        kept = _entries_since(history, cutoff_date)
+        if len(kept) != len(history):
+            save_balance_history(account_name, kept)
+            self.logger.debug(f"Compacted balance history for {account_name}: {len(history) - len(kept)} entries dropped")
+    
     async def update_all_reports(self):
         """Update all reports (called from main loop)"""
         try:
-            # This would typically be called with actual account data
-            # For now, it's a placeholder that can be extended
+            now = time.monotonic()
+            if self._last_compaction is None or now - self._last_compaction >= self.COMPACTION_INTERVAL:
+                self._last_compaction = now
+                for account_name in list(self._history_accounts):
+                    try:
+                        self._compact_balance_history(account_name)
+                    except Exception as e:
+                        self.logger.error(f"Failed to compact balance history for {account_name}: {e}")
+            
             self.logger.debug("Report update cycle completed")
             
         except Exception as e:
             self.logger.error(f"Failed to update reports: {e}")
     
+    @staticmethod
+    def _latest_report_link(account_name: str) -> Path:
+        """Path of the {account}_latest.json pointer to the newest daily report"""
+        return Path(f"data/reports/{account_name}_latest.json")
+    
+    def _update_latest_report_link(self, account_name: str, report_path: Path):
+        """Point {account}_latest.json at a report: a relative symlink, or a copy where symlinks are unavailable"""
+        latest = self._latest_report_link(account_name)
+        tmp_link = latest.with_name(f"{latest.name}.tmp")
+        try:
+            try:
+                tmp_link.unlink()
+            except FileNotFoundError:
+                pass
+            try:
+                tmp_link.symlink_to(report_path.name)
+            except (OSError, NotImplementedError):
+                shutil.copyfile(report_path, tmp_link)
+            # Swap in atomically so readers never see the pointer missing
+            os.replace(tmp_link, latest)
+        except OSError as e:
+            self.logger.warning(f"Failed to update latest report link for {account_name}: {e}")
+    
     def get_latest_report(self, account_name: str) -> Optional[Dict[str, Any]]:
         """Get the latest report for an account"""
         try:
-            # Find latest report file
+            # Constant-time lookup through the pointer written with each report
+            latest = load_json_file(self._latest_report_link(account_name))
+            if latest is not None:
+                return latest
+            
+            # Reports written before the pointer existed: find latest report file
             reports_dir = Path("data/reports")
             if not reports_dir.exists():
                 return None
@@ -473,18 +980,18 @@ class ReportingManager:
             reports_dir = Path("data/reports")
             charts_dir = Path("data/charts")
             
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+            cutoff = (datetime.now() - timedelta(days=days_to_keep)).timestamp()
             
             for directory in [reports_dir, charts_dir]:
                 if not directory.exists():
                     continue
                 
-                for file_path in directory.glob("*"):
-                    if file_path.is_file():
-                        file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                        if file_time < cutoff_date:
-                            file_path.unlink()
-                            self.logger.debug(f"Deleted old report file: {file_path}")
+                # scandir entries carry their file type, so only stat() costs a syscall
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            self.logger.debug(f"Deleted old report file: {entry.path}")
             
         except Exception as e:
             self.logger.error(f"Failed to cleanup old reports: {e}")
\ No newline at end of file
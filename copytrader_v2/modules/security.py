@@ -7,8 +7,13 @@ import hashlib
 import hmac
 import secrets
 import base64
+import functools
+import ssl
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Any, List, Union
-from datetime import datetime, timedelta
+from datetime import datetime
 import re
 from pathlib import Path
 import json
@@ -30,17 +35,59 @@ try:
 except ImportError:
     CRYPTOGRAPHY_AVAILABLE = False
 
+# Input validation patterns, compiled once
+_API_KEY_RE = re.compile(r'^[A-Za-z0-9\-_]+$')
+_API_SECRET_RE = re.compile(r'^[A-Za-z0-9\-_=+/]+$')
+_URL_RE = re.compile(r'^https://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(/.*)?$')
+_SYMBOL_RE = re.compile(r'^[A-Z0-9]{3,20}$')
+_B64URL_RE = re.compile(r'[A-Za-z0-9_-]+')
+
+# Keys whose values sanitize_for_logging masks (matched anywhere in the key, any case)
+_SENSITIVE_KEY_RE = re.compile(
+    r'api_key|api_secret|password|token|secret|private_key|auth_token|session_id',
+    re.IGNORECASE
+)
+
+# Unpadded URL-safe base64 length of 24 bytes, the minimum session token entropy
+_SESSION_TOKEN_MIN_LENGTH = 32
+
+# Characters stripped by sanitize_string, as a str.translate table
+_SANITIZE_TABLE = str.maketrans('', '', '<>"\'\\/')
+
+# Pure string validators, cached since the same keys, URLs and symbols are
+# validated over and over; InputValidator checks the type before calling them
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_api_key(api_key: str) -> bool:
+    """API key format: 20-50 alphanumeric characters, hyphens or underscores"""
+    return 20 <= len(api_key) <= 50 and _API_KEY_RE.match(api_key) is not None
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_url(url: str) -> bool:
+    """HTTPS URL with a dotted host name"""
+    return url.startswith('https://') and _URL_RE.match(url) is not None
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_symbol(symbol: str) -> bool:
+    """Trading symbol: 3-20 uppercase letters or digits"""
+    return _SYMBOL_RE.match(symbol) is not None
+
 class EncryptionManager:
     """Manages encryption and decryption of sensitive data"""
     
+    PBKDF2_ITERATIONS = 100000
+    
     def __init__(self):
         self.logger = get_logger('security')
         self._encryption_key = None
+        self._check_hash_acceleration()
         
         if CRYPTOGRAPHY_AVAILABLE:
             self._initialize_encryption()
         else:
             self.logger.warning("Cryptography not available - sensitive data will not be encrypted")
+            # Bound once here so encrypt/decrypt need no availability check per call
+            self.encrypt = self.decrypt = self._passthrough
     
     def _initialize_encryption(self):
         """Initialize encryption key from environment or generate new one"""
@@ -66,6 +113,23 @@ class EncryptionManager:
         
         self.logger.warning("Generated new encryption key - save COPYTRADER_ENCRYPTION_KEY to environment")
     
+    def _check_hash_acceleration(self):
+        """Log the OpenSSL build and warn if the CPU lacks the SHA extensions PBKDF2 benefits from"""
+        self.logger.debug(f"Hashing with {ssl.OPENSSL_VERSION}")
+        
+        if not sys.platform.startswith('linux'):
+            return
+        try:
+            with open('/proc/cpuinfo') as f:
+                for line in f:
+                    # x86 lists CPU features on 'flags' lines; other architectures are not checked
+                    if line.startswith('flags'):
+                        if 'sha_ni' not in line.split():
+                            self.logger.warning("CPU has no SHA extensions (sha_ni) - PBKDF2 hashing runs unaccelerated")
+                        return
+        except OSError:
+            pass
+    
     def _save_key_to_env(self, key: bytes):
         """Save encryption key to .env file"""
         try:
@@ -94,26 +158,27 @@ class EncryptionManager:
         except Exception as e:
             self.logger.error(f"Failed to save encryption key to .env: {e}")
     
+    @staticmethod
+    def _passthrough(data: str) -> str:
+        """encrypt/decrypt without cryptography: data is returned as-is"""
+        return data
+    
     def encrypt(self, data: str) -> str:
-        """Encrypt sensitive data"""
-        if not CRYPTOGRAPHY_AVAILABLE or not self._encryption_key:
-            return data  # Return plaintext if encryption not available
-        
+        """Encrypt sensitive data (a Fernet token, which is already URL-safe base64)"""
         try:
-            encrypted_bytes = self._encryption_key.encrypt(data.encode())
-            return base64.urlsafe_b64encode(encrypted_bytes).decode()
+            return self._encryption_key.encrypt(data.encode()).decode('ascii')
         except Exception as e:
             raise EncryptionError(f"Failed to encrypt data: {e}")
     
     def decrypt(self, encrypted_data: str) -> str:
         """Decrypt sensitive data"""
-        if not CRYPTOGRAPHY_AVAILABLE or not self._encryption_key:
-            return encrypted_data  # Return as-is if encryption not available
-        
         try:
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
-            decrypted_bytes = self._encryption_key.decrypt(encrypted_bytes)
-            return decrypted_bytes.decode()
+            token = encrypted_data.encode('ascii')
+            # Fernet tokens start with 'g' (version byte 0x80); values encrypted
+            # by earlier versions carry an extra base64 layer ('Z...')
+            if token[:1] != b'g':
+                token = base64.urlsafe_b64decode(token)
+            return self._encryption_key.decrypt(token).decode()
         except Exception as e:
             raise EncryptionError(f"Failed to decrypt data: {e}")
     
@@ -123,71 +188,96 @@ class EncryptionManager:
             salt = secrets.token_hex(16)
         
         # Use PBKDF2 for secure hashing
-        hash_func = hashlib.pbkdf2_hmac('sha256', data.encode(), salt.encode(), 100000)
+        hash_func = hashlib.pbkdf2_hmac('sha256', data.encode(), salt.encode(), self.PBKDF2_ITERATIONS)
         return f"{salt}${base64.urlsafe_b64encode(hash_func).decode()}"
     
+    def hash_sensitive_data_many(self, items: List[str]) -> List[str]:
+        """
+        Hash several values (each with its own salt), in parallel threads
+        hashlib releases the GIL while computing PBKDF2, so the work spreads over the cores
+        """
+        if len(items) < 2:
+            return [self.hash_sensitive_data(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(len(items), os.cpu_count() or 1)) as executor:
+            return list(executor.map(self.hash_sensitive_data, items))
+    
     def verify_hash(self, data: str, hashed_data: str) -> bool:
         """Verify data against secure hash"""
         try:
             salt, hash_value = hashed_data.split('$', 1)
-            expected_hash = self.hash_sensitive_data(data, salt)
-            return hmac.compare_digest(expected_hash, hashed_data)
+            # Compare the raw digests; only the stored hash needs decoding
+            expected_hash = hashlib.pbkdf2_hmac('sha256', data.encode(), salt.encode(), self.PBKDF2_ITERATIONS)
+            return hmac.compare_digest(expected_hash, base64.urlsafe_b64decode(hash_value.encode()))
         except Exception:
             return False
 
 class RateLimiter:
-    """Rate limiting for API calls and user actions"""
+    """
+    Rate limiting for API calls and user actions
+    Token bucket per identifier: the bucket holds up to max_requests tokens and
+    refills at max_requests per window; each allowed request takes one token
+    """
+    
+    # How long an identifier is blocked after exhausting its bucket
+    BLOCK_MINUTES = 5
     
     def __init__(self):
         self.logger = get_logger('security')
-        self.request_history: Dict[str, List[datetime]] = {}
-        self.blocked_until: Dict[str, datetime] = {}
+        # [tokens, last refill time]; times and block deadlines are time.monotonic() seconds
+        self.buckets: Dict[str, List[float]] = {}
+        self.blocked_until: Dict[str, float] = {}
     
     def is_allowed(self, identifier: str, max_requests: int = 10, window_minutes: int = 1) -> bool:
         """Check if request is allowed within rate limits"""
-        now = datetime.now()
+        now = time.monotonic()
         
         # Check if currently blocked
-        if identifier in self.blocked_until:
-            if now < self.blocked_until[identifier]:
+        blocked_until = self.blocked_until.get(identifier)
+        if blocked_until is not None:
+            if now < blocked_until:
                 return False
-            else:
-                del self.blocked_until[identifier]
+            del self.blocked_until[identifier]
         
-        # Clean old requests
-        if identifier not in self.request_history:
-            self.request_history[identifier] = []
-        
-        cutoff_time = now - timedelta(minutes=window_minutes)
-        self.request_history[identifier] = [
-            req_time for req_time in self.request_history[identifier]
-            if req_time > cutoff_time
-        ]
+        bucket = self.buckets.get(identifier)
+        if bucket is None:
+            bucket = self.buckets[identifier] = [float(max_requests), now]
+        else:
+            # Refill for the time since the last request, up to a full bucket
+            refill_rate = max_requests / (window_minutes * 60)
+            bucket[0] = min(float(max_requests), bucket[0] + (now - bucket[1]) * refill_rate)
+            bucket[1] = now
         
         # Check rate limit
-        if len(self.request_history[identifier]) >= max_requests:
-            # Block for escalating time based on violations
-            block_minutes = min(60, len(self.request_history[identifier]) - max_requests + 5)
-            self.blocked_until[identifier] = now + timedelta(minutes=block_minutes)
+        if bucket[0] < 1:
+            self.blocked_until[identifier] = now + self.BLOCK_MINUTES * 60
             
-            self.logger.warning(f"Rate limit exceeded for {identifier}, blocked for {block_minutes} minutes")
+            self.logger.warning(f"Rate limit exceeded for {identifier}, blocked for {self.BLOCK_MINUTES} minutes")
             return False
         
-        # Record this request
-        self.request_history[identifier].append(now)
+        # Take a token for this request
+        bucket[0] -= 1
         return True
     
     def reset_limits(self, identifier: str):
         """Reset rate limits for identifier"""
-        self.request_history.pop(identifier, None)
+        self.buckets.pop(identifier, None)
         self.blocked_until.pop(identifier, None)
     
     def get_remaining_requests(self, identifier: str, max_requests: int = 10, window_minutes: int = 1) -> int:
-        """Get remaining requests in current window"""
-        if not self.is_allowed(identifier, max_requests, window_minutes):
+        """Get remaining requests in current window (does not use up a request)"""
+        now = time.monotonic()
+        
+        blocked_until = self.blocked_until.get(identifier)
+        if blocked_until is not None and now < blocked_until:
             return 0
         
-        return max_requests - len(self.request_history.get(identifier, []))
+        bucket = self.buckets.get(identifier)
+        if bucket is None:
+            return max_requests
+        
+        refill_rate = max_requests / (window_minutes * 60)
+        return int(min(float(max_requests), bucket[0] + (now - bucket[1]) * refill_rate))
 
 class InputValidator:
     """Validates and sanitizes user inputs"""
@@ -200,15 +290,8 @@ class InputValidator:
         if not api_key or not isinstance(api_key, str):
             return False
         
-        # Basic format validation (adjust based on Bybit API key format)
-        if len(api_key) < 20 or len(api_key) > 50:
-            return False
-        
-        # Should contain only alphanumeric characters and hyphens
-        if not re.match(r'^[A-Za-z0-9\-_]+$', api_key):
-            return False
-        
-        return True
+        # Length and character set (adjust based on Bybit API key format)
+        return _is_valid_api_key(api_key)
     
     def validate_api_secret(self, api_secret: str) -> bool:
         """Validate API secret format"""
@@ -220,7 +303,7 @@ class InputValidator:
             return False
         
         # Should contain only alphanumeric characters and special chars
-        if not re.match(r'^[A-Za-z0-9\-_=+/]+$', api_secret):
+        if not _API_SECRET_RE.match(api_secret):
             return False
         
         return True
@@ -230,16 +313,8 @@ class InputValidator:
         if not url or not isinstance(url, str):
             return False
         
-        # Must be HTTPS for security
-        if not url.startswith('https://'):
-            return False
-        
-        # Basic URL pattern
-        url_pattern = r'^https://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(/.*)?$'
-        if not re.match(url_pattern, url):
-            return False
-        
-        return True
+        # Must be HTTPS for security, with a basic host pattern
+        return _is_valid_url(url)
     
     def validate_symbol(self, symbol: str) -> bool:
         """Validate trading symbol"""
@@ -247,10 +322,7 @@ class InputValidator:
             return False
         
         # Symbol should be uppercase letters/numbers
-        if not re.match(r'^[A-Z0-9]{3,20}$', symbol):
-            return False
-        
-        return True
+        return _is_valid_symbol(symbol)
     
     def validate_quantity(self, quantity: Union[str, float, int]) -> bool:
         """Validate trading quantity"""
@@ -274,7 +346,7 @@ class InputValidator:
             return ""
         
         # Remove potentially dangerous characters
-        sanitized = re.sub(r'[<>"\'\\/]', '', text)
+        sanitized = text.translate(_SANITIZE_TABLE)
         
         # Limit length
         return sanitized[:max_length]
@@ -379,14 +451,9 @@ class SecurityManager:
     
     def sanitize_for_logging(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize data for safe logging (remove sensitive info)"""
-        sensitive_keys = [
-            'api_key', 'api_secret', 'password', 'token', 'secret',
-            'private_key', 'auth_token', 'session_id'
-        ]
-        
         sanitized = {}
         for key, value in data.items():
-            if any(sensitive_key in key.lower() for sensitive_key in sensitive_keys):
+            if _SENSITIVE_KEY_RE.search(key):
                 if isinstance(value, str) and len(value) > 4:
                     sanitized[key] = f"{value[:4]}...{value[-4:]}"
                 else:
@@ -402,15 +469,12 @@ class SecurityManager:
     
     def validate_session_token(self, token: str) -> bool:
         """Validate session token format"""
-        if not isinstance(token, str):
+        # At least 24 bytes of entropy; the length check rejects most garbage cheaply
+        if not isinstance(token, str) or len(token) < _SESSION_TOKEN_MIN_LENGTH:
             return False
         
-        # Should be URL-safe base64
-        try:
-            decoded = base64.urlsafe_b64decode(token + '==')
-            return len(decoded) >= 24  # At least 24 bytes of entropy
-        except Exception:
-            return False
+        # Should be URL-safe base64 (a length of 4n+1 never decodes)
+        return len(token) % 4 != 1 and _B64URL_RE.fullmatch(token) is not None
     
     def create_signature(self, data: str, secret: str) -> str:
         """Create HMAC signature for data verification"""
@@ -430,7 +494,7 @@ class SecurityManager:
         return {
             "encryption_available": CRYPTOGRAPHY_AVAILABLE,
             "active_rate_limits": len(self.rate_limiter.blocked_until),
-            "recent_requests": sum(len(reqs) for reqs in self.rate_limiter.request_history.values()),
+            "tracked_identifiers": len(self.rate_limiter.buckets),
             "timestamp": datetime.now().isoformat()
         }
 
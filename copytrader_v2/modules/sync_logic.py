@@ -16,7 +16,7 @@ from .exceptions import (
     create_error_context
 )
 from .logger import get_logger, log_sync_event, log_trading_action
-from .api_handler import BybitAPIHandler
+from .api_handler import BybitAPIHandler, gather_or_cancel
 from .file_utils import AccountConfig, save_sync_state, load_sync_state
 
 class PositionInfo:
@@ -120,6 +120,10 @@ class SyncManager:
             if not slave_healthy:
                 raise SynchronizationError(f"Slave account {self.slave_config.nickname} API not healthy")
             
+            # Push-based position/order snapshots; REST is used until they are live
+            await self.master_api.start_private_stream()
+            await self.slave_api.start_private_stream()
+            
             log_sync_event(
                 self.logger, 
                 "initialized", 
@@ -157,11 +161,15 @@ class SyncManager:
         try:
             self.logger.debug("Starting sync cycle")
             
-            # Get current state from both accounts
-            master_positions = await self._get_master_positions()
-            master_orders = await self._get_master_orders()
-            slave_positions = await self._get_slave_positions()
-            slave_orders = await self._get_slave_orders()
+            # Get current state from both accounts concurrently
+            master_snapshot, slave_snapshot = await gather_or_cancel(
+                self.master_api.snapshot(category="linear", include_wallet=False),
+                self.slave_api.snapshot(category="linear", include_wallet=bool(self.sl_loss_tiers))
+            )
+            master_positions = self._get_master_positions(master_snapshot['positions'])
+            master_orders = self._get_master_orders(master_snapshot['open_orders'])
+            slave_positions = self._get_slave_positions(slave_snapshot['positions'])
+            slave_orders = self._get_slave_orders(slave_snapshot['open_orders'])
             
             # Synchronize positions
             await self._sync_positions(master_positions, slave_positions)
@@ -170,7 +178,7 @@ class SyncManager:
             await self._sync_orders(master_orders, slave_orders)
             
             # Check stop-loss conditions
-            await self._check_stop_loss_conditions(slave_positions)
+            await self._check_stop_loss_conditions(slave_positions, slave_snapshot['wallet'])
             
             # Update sync state
             self.last_sync_time = datetime.now(timezone.utc)
@@ -182,10 +190,9 @@ class SyncManager:
             self.logger.error(f"Error in sync cycle: {e}", exc_info=True)
             raise SynchronizationError(f"Sync cycle failed: {e}")
     
-    async def _get_master_positions(self) -> List[PositionInfo]:
-        """Get positions from master account"""
+    def _get_master_positions(self, positions_data: List[Dict[str, Any]]) -> List[PositionInfo]:
+        """Get copyable open positions from master account data"""
         try:
-            positions_data = await self.master_api.get_positions(category="linear")
             positions = []
             
             for pos_data in positions_data:
@@ -198,19 +205,17 @@ class SyncManager:
         except Exception as e:
             raise PositionSyncError(f"Failed to get master positions: {e}")
     
-    async def _get_slave_positions(self) -> List[PositionInfo]:
-        """Get positions from slave account"""
+    def _get_slave_positions(self, positions_data: List[Dict[str, Any]]) -> List[PositionInfo]:
+        """Get open positions from slave account data"""
         try:
-            positions_data = await self.slave_api.get_positions(category="linear")
             return [PositionInfo(pos_data) for pos_data in positions_data if PositionInfo(pos_data).is_open]
             
         except Exception as e:
             raise PositionSyncError(f"Failed to get slave positions: {e}")
     
-    async def _get_master_orders(self) -> List[OrderInfo]:
-        """Get open orders from master account"""
+    def _get_master_orders(self, orders_data: List[Dict[str, Any]]) -> List[OrderInfo]:
+        """Get copyable active orders from master account data"""
         try:
-            orders_data = await self.master_api.get_open_orders(category="linear")
             orders = []
             
             for order_data in orders_data:
@@ -223,10 +228,9 @@ class SyncManager:
         except Exception as e:
             raise OrderSyncError(f"Failed to get master orders: {e}")
     
-    async def _get_slave_orders(self) -> List[OrderInfo]:
-        """Get open orders from slave account"""
+    def _get_slave_orders(self, orders_data: List[Dict[str, Any]]) -> List[OrderInfo]:
+        """Get active orders from slave account data"""
         try:
-            orders_data = await self.slave_api.get_open_orders(category="linear")
             return [OrderInfo(order_data) for order_data in orders_data if OrderInfo(order_data).is_active]
             
         except Exception as e:
@@ -420,10 +424,11 @@ class SyncManager:
         # This prevents conflicting orders and keeps things simple
         
         try:
-            # Cancel all existing slave orders
-            for slave_order in slave_orders:
-                if self._should_copy_symbol(slave_order.symbol):
-                    await self._cancel_slave_order(slave_order)
+            # Cancel all existing slave orders in a single batch
+            await self._cancel_slave_orders([
+                slave_order for slave_order in slave_orders
+                if self._should_copy_symbol(slave_order.symbol)
+            ])
             
             # Note: We don't copy pending orders from master to slave
             # as this could interfere with position synchronization
@@ -433,28 +438,46 @@ class SyncManager:
             self.logger.error(f"Failed to sync orders: {e}")
             # Don't raise exception for order sync failures
     
-    async def _cancel_slave_order(self, order: OrderInfo):
-        """Cancel an order on slave account"""
+    async def _cancel_slave_orders(self, orders: List[OrderInfo]):
+        """Cancel orders on slave account using the batch endpoint"""
+        if not orders:
+            return
+        
         try:
-            await self.slave_api.cancel_order(
+            results = await self.slave_api.cancel_orders_batch(
                 category="linear",
-                symbol=order.symbol,
-                order_id=order.order_id
+                orders=[{"symbol": order.symbol, "orderId": order.order_id} for order in orders]
             )
             
-            self.logger.debug(f"Cancelled slave order: {order}")
+            # The batch succeeds as a whole; each order reports its own outcome
+            rejected = [result for result in results if result.get('code', 0) != 0]
+            for result in rejected:
+                self.logger.warning(
+                    f"Failed to cancel slave order {result.get('orderId') or '?'}: "
+                    f"{result.get('code')} {result.get('msg')}"
+                )
+            
+            self.logger.debug(f"Cancelled {len(results) - len(rejected)} of {len(orders)} slave orders")
             
         except Exception as e:
-            self.logger.warning(f"Failed to cancel slave order {order.order_id}: {e}")
+            self.logger.warning(f"Failed to cancel slave orders: {e}")
     
-    async def _check_stop_loss_conditions(self, slave_positions: List[PositionInfo]):
-        """Check and execute stop-loss conditions"""
+    async def _check_stop_loss_conditions(
+        self,
+        slave_positions: List[PositionInfo],
+        balance_data: Optional[Dict[str, Any]]
+    ):
+        """
+        Check and execute stop-loss conditions against the slave wallet balance
+        balance_data is None when the wallet could not be fetched this cycle
+        """
         if not self.sl_loss_tiers:
             return
+        if balance_data is None:
+            self.logger.error("Slave wallet balance unavailable - skipping stop-loss check this cycle")
+            return
         
         try:
-            # Get slave account balance
-            balance_data = await self.slave_api.get_wallet_balance()
             total_wallet_balance = Decimal('0')
             
             if 'list' in balance_data and balance_data['list']:
@@ -479,9 +502,62 @@ class SyncManager:
         try:
             self.logger.warning(f"Stop-loss tier ${tier_usd} triggered - closing all positions")
             
+            # Close every position with one batch request instead of one call each
+            close_orders = []
             for position in positions:
-                await self._close_slave_position(position)
-                await asyncio.sleep(0.5)  # Prevent rate limiting
+                close_side = "Sell" if position.side == "Buy" else "Buy"
+                close_orders.append(BybitAPIHandler.build_order_request(
+                    symbol=position.symbol,
+                    side=close_side,
+                    order_type="Market",
+                    qty=str(position.size),
+                    time_in_force="IOC",
+                    reduce_only=True
+                ))
+            
+            results = []
+            if close_orders:
+                try:
+                    results = await self.slave_api.place_orders_batch(category="linear", orders=close_orders)
+                except Exception as e:
+                    self.logger.error(f"Stop-loss batch close failed, closing positions one by one: {e}")
+            
+            # Only orders the exchange accepted count as closed; the rest are
+            # retried one at a time (reduce-only, so a retry cannot open a position)
+            retry_positions = []
+            for i, (position, order) in enumerate(zip(positions, close_orders)):
+                result = results[i] if i < len(results) else None
+                if result is None or result.get('code', 0) != 0:
+                    if result is not None:
+                        self.logger.error(
+                            f"Stop-loss close rejected for {position.symbol}: "
+                            f"{result.get('code')} {result.get('msg')}"
+                        )
+                    retry_positions.append(position)
+                    continue
+                
+                log_trading_action(
+                    self.logger,
+                    "position_close",
+                    position.symbol,
+                    order["side"],
+                    float(position.size),
+                    slave_account=self.slave_config.nickname
+                )
+            
+            open_symbols = []
+            for position in retry_positions:
+                try:
+                    await self._close_slave_position(position)
+                except PositionSyncError as e:
+                    self.logger.error(str(e))
+                    open_symbols.append(position.symbol)
+            
+            if open_symbols:
+                self.logger.error(
+                    f"Stop-loss tier ${tier_usd} left positions open: {', '.join(open_symbols)}"
+                )
+                return
             
             log_sync_event(
                 self.logger,
@@ -201,20 +201,30 @@ class ReportingManager:
         self._save_json(self.pnl_report_file, pnl_report_payload)
         logger.info("PnL riport (aggregált és nyers) sikeresen frissítve.")
 
+    @staticmethod
+    def _day_start_ms(day):
+        """Egy UTC nap kezdetének epoch ezredmásodperce (egész számos összehasonlításhoz)."""
+        return int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp() * 1000)
+
     def _calculate_periodic_pnl(self, pnl_history):
-        now_utc, today_utc = datetime.now(timezone.utc), datetime.now(timezone.utc).date()
+        today_utc = datetime.now(timezone.utc).date()
         start_of_week, start_of_month = today_utc - timedelta(days=today_utc.weekday()), today_utc.replace(day=1)
+        # A határokat egyszer számoljuk ki ms-ban, így rekordonként nem kell datetime-ot építeni
+        today_start_ms = self._day_start_ms(today_utc)
+        today_end_ms = today_start_ms + 86_400_000
+        week_start_ms = self._day_start_ms(start_of_week)
+        month_start_ms = self._day_start_ms(start_of_month)
         periods = {"Mai": {"pnl": 0.0, "trade_count": 0},"Heti": {"pnl": 0.0, "trade_count": 0},"Havi": {"pnl": 0.0, "trade_count": 0},"Teljes": {"pnl": 0.0, "trade_count": 0}}
         if pnl_history and (timestamps := [int(p['createdTime']) for p in pnl_history if p.get('createdTime')]):
             start_date = datetime.fromtimestamp(min(timestamps) / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
         else: start_date = "N/A"
         for entry in pnl_history:
-            created_date_utc = datetime.fromtimestamp(int(entry['createdTime']) / 1000, tz=timezone.utc).date()
+            created_ms = int(entry['createdTime'])
             pnl = float(entry.get('closedPnl', 0))
             periods["Teljes"]["pnl"] += pnl; periods["Teljes"]["trade_count"] += 1
-            if created_date_utc >= start_of_month: periods["Havi"]["pnl"] += pnl; periods["Havi"]["trade_count"] += 1
-            if created_date_utc >= start_of_week: periods["Heti"]["pnl"] += pnl; periods["Heti"]["trade_count"] += 1
-            if created_date_utc == today_utc: periods["Mai"]["pnl"] += pnl; periods["Mai"]["trade_count"] += 1
+            if created_ms >= month_start_ms: periods["Havi"]["pnl"] += pnl; periods["Havi"]["trade_count"] += 1
+            if created_ms >= week_start_ms: periods["Heti"]["pnl"] += pnl; periods["Heti"]["trade_count"] += 1
+            if today_start_ms <= created_ms < today_end_ms: periods["Mai"]["pnl"] += pnl; periods["Mai"]["trade_count"] += 1
         for data in periods.values(): data["pnl"] = round(data["pnl"], 2)
         return {"start_date": start_date, "periods": periods}
         
@@ -250,8 +260,9 @@ class ReportingManager:
             last_trade = max(pnl_history, key=lambda x: int(x.get('createdTime', 0)))
             closed_pnl = float(last_trade.get('closedPnl', 0))
             # Napi PnL számítása (csak a mai napra)
-            today_utc = now_utc.date()
-            daily_pnl = sum(float(entry.get('closedPnl', 0)) for entry in pnl_history if datetime.fromtimestamp(int(entry['createdTime']) / 1000, tz=timezone.utc).date() == today_utc)
+            today_start_ms = self._day_start_ms(now_utc.date())
+            today_end_ms = today_start_ms + 86_400_000
+            daily_pnl = sum(float(entry.get('closedPnl', 0)) for entry in pnl_history if today_start_ms <= int(entry['createdTime']) < today_end_ms)
         else:
             closed_pnl = None
             daily_pnl = 0.0
@@ -1,6 +1,7 @@
 """
 Setup script for Copytrader v2
 """
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -25,6 +26,13 @@ if dev_requirements_file.exists():
             if line.strip() and not line.startswith('#') and not line.startswith('-r')
         ]
 
+# Optionally compile the logging hot path to a C extension with mypyc
+# (COPYTRADER_MYPYC=1 pip install .); the pure-Python module is used otherwise
+ext_modules = []
+if os.environ.get("COPYTRADER_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["copytrader_v2/modules/_logger_fast.py"])
+
 setup(
     name="copytrader",
     version="2.0.0",
@@ -50,6 +58,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    ext_modules=ext_modules,
     extras_require={
         "dev": dev_requirements,
         "security": [
@@ -0,0 +1,93 @@
+"""
+Unit tests for the copytrader_v2 exception hierarchy.
+"""
+import json
+
+import pytest
+
+from copytrader_v2.modules.exceptions import (
+    APIConnectionError,
+    APIError,
+    APINetworkError,
+    APITimeoutError,
+    CopytraderError,
+    DataSerializationError,
+    DataValidationError,
+    FileOperationError,
+    handle_exception_with_context,
+)
+
+# Stand-ins shaped like the requests exception hierarchy, so the name-based
+# mapping is tested without requests installed
+class RequestException(OSError):
+    pass
+
+class ConnectionError(RequestException):
+    pass
+
+class HTTPError(RequestException):
+    pass
+
+class InvalidJSONError(RequestException):
+    pass
+
+class JSONDecodeError(InvalidJSONError, json.JSONDecodeError):
+    pass
+
+class ReadTimeout(RequestException):
+    pass
+
+def _convert(exception):
+    return type(handle_exception_with_context(exception, {'operation': 'test'}))
+
+class TestExceptionMapping:
+    """Tests for handle_exception_with_context class resolution"""
+
+    def test_builtin_types(self):
+        assert _convert(TimeoutError('t')) is APITimeoutError
+        assert _convert(ValueError('v')) is DataValidationError
+        assert _convert(FileNotFoundError('f')) is FileOperationError
+        assert _convert(json.JSONDecodeError('bad', '{', 0)) is DataSerializationError
+
+    def test_builtin_subclasses_use_nearest_base(self):
+        assert _convert(ConnectionRefusedError('r')) is APIConnectionError
+        assert _convert(UnicodeDecodeError('utf-8', b'\xff', 0, 1, 'bad')) is DataValidationError
+
+    def test_requests_connection_error_maps_to_connection_error(self):
+        assert _convert(ConnectionError('down')) is APIConnectionError
+
+    def test_requests_json_decode_error_maps_to_serialization_error(self):
+        assert _convert(JSONDecodeError('bad', '{', 0)) is DataSerializationError
+
+    def test_requests_base_classes(self):
+        assert _convert(HTTPError('500')) is APIError
+        assert _convert(ReadTimeout('slow')) is APINetworkError
+
+    def test_unknown_type_falls_back_to_base_error(self):
+        assert _convert(RuntimeError('x')) is CopytraderError
+
+    def test_real_requests_exceptions(self):
+        requests = pytest.importorskip('requests')
+        assert _convert(requests.ConnectionError('down')) is APIConnectionError
+        assert _convert(requests.JSONDecodeError('bad', '{', 0)) is DataSerializationError
+
+class TestCopytraderError:
+    """Tests for the base exception"""
+
+    def test_pickle_round_trip(self):
+        import pickle
+
+        error = CopytraderError('x', 'E1', {'a': 1})
+        restored = pickle.loads(pickle.dumps(error))
+        assert restored.message == 'x'
+        assert restored.error_code == 'E1'
+        assert restored.context == {'a': 1}
+        assert restored.timestamp == error.timestamp
+
+    def test_copy_keeps_fields(self):
+        import copy
+
+        error = DataValidationError('bad', 'E2', {'field': 'qty'})
+        copied = copy.copy(error)
+        assert type(copied) is DataValidationError
+        assert (copied.error_code, copied.context) == ('E2', {'field': 'qty'})
@@ -0,0 +1,56 @@
+"""
+Unit tests for the copytrader_v2 balance history log.
+"""
+import pytest
+
+from copytrader_v2.modules.file_utils import (
+    get_balance_history_file,
+    load_balance_history,
+    load_balance_history_tail,
+    save_balance_history_append,
+)
+
+@pytest.fixture(autouse=True)
+def workdir(monkeypatch, tmp_path):
+    """History files live under data/ relative to the working directory"""
+    monkeypatch.chdir(tmp_path)
+
+class TestBalanceHistory:
+    """Tests for the JSON Lines balance history"""
+
+    def test_append_and_load(self):
+        save_balance_history_append('main', {'balance': 1})
+        save_balance_history_append('main', {'balance': 2})
+        assert load_balance_history('main') == [{'balance': 1}, {'balance': 2}]
+
+    def test_load_skips_torn_last_line(self):
+        save_balance_history_append('main', {'balance': 1})
+        with open(get_balance_history_file('main'), 'ab') as f:
+            f.write(b'{"balance": 2')  # Interrupted append
+        assert load_balance_history('main') == [{'balance': 1}]
+
+    def test_append_after_torn_line_starts_fresh_line(self):
+        save_balance_history_append('main', {'balance': 1})
+        with open(get_balance_history_file('main'), 'ab') as f:
+            f.write(b'{"balance": 2')
+        save_balance_history_append('main', {'balance': 3})
+        assert load_balance_history('main') == [{'balance': 1}, {'balance': 3}]
+
+    def test_tail_reads_only_complete_lines(self):
+        save_balance_history_append('main', {'balance': 1})
+        entries, offset, inode = load_balance_history_tail('main')
+        assert entries == [{'balance': 1}]
+        assert inode is not None
+
+        with open(get_balance_history_file('main'), 'ab') as f:
+            f.write(b'{"balance": 2')
+        assert load_balance_history_tail('main', offset)[:2] == ([], offset)
+
+        with open(get_balance_history_file('main'), 'ab') as f:
+            f.write(b'}\n')
+        entries, new_offset, _ = load_balance_history_tail('main', offset)
+        assert entries == [{'balance': 2}]
+        assert new_offset == get_balance_history_file('main').stat().st_size
+
+    def test_tail_of_missing_file(self):
+        assert load_balance_history_tail('none') == ([], 0, None)
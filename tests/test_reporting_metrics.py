@@ -0,0 +1,67 @@
+"""
+Unit tests for the copytrader_v2 reporting metrics and chart downsampling.
+"""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from copytrader_v2.modules.reporting_manager import PerformanceMetrics, _lttb
+
+BALANCE_SERIES = [
+    [1000.0],
+    [1000.0, 1000.0, 1000.0],
+    [1000.0, 1100.0, 900.0, 950.0, 1200.0, 1150.0],
+    [500.0, 400.0, 300.0, 600.0],
+    [0.0, 0.0, 10.0, 5.0],
+]
+
+class TestComputeMetrics:
+    """The compiled kernel must agree with the numpy implementation"""
+
+    @pytest.mark.parametrize('balances', BALANCE_SERIES)
+    def test_numba_matches_numpy(self, balances):
+        kernel = pytest.importorskip('copytrader_v2.modules._metrics_numba')
+        arr = np.asarray(balances, dtype=np.float64)
+        daily_pnl = np.diff(arr)
+
+        compiled = kernel.compute_metrics(arr, 0.02 / 365)
+        expected = (
+            *PerformanceMetrics._max_drawdown_arr(arr),
+            PerformanceMetrics.calculate_sharpe_ratio(daily_pnl, 0.02),
+            float(daily_pnl.mean()) if len(daily_pnl) else 0.0,
+            int(np.count_nonzero(daily_pnl > 0)),
+        )
+        assert np.allclose(compiled[:4], expected[:4])
+        assert compiled[4] == expected[4]
+
+    def test_random_walk(self):
+        kernel = pytest.importorskip('copytrader_v2.modules._metrics_numba')
+        rng = np.random.default_rng(7)
+        arr = 1000.0 + np.cumsum(rng.normal(0, 25, 2000))
+
+        compiled = kernel.compute_metrics(arr, 0.02 / 365)
+        assert np.isclose(compiled[0], PerformanceMetrics._max_drawdown_arr(arr)[0])
+        assert np.isclose(compiled[2], PerformanceMetrics.calculate_sharpe_ratio(np.diff(arr)))
+
+    def test_drawdown(self):
+        result = PerformanceMetrics.compute_metrics(np.array([100.0, 120.0, 90.0, 130.0]))
+        assert result[0] == pytest.approx(25.0)
+        assert result[1] == pytest.approx(30.0)
+        assert result[4] == 2
+
+class TestLttb:
+    """Tests for Largest-Triangle-Three-Buckets downsampling"""
+
+    def test_keeps_endpoints_and_threshold_points(self):
+        x = np.arange(1000, dtype=np.float64)
+        y = np.sin(x / 25)
+        indices = _lttb(x, y, 100)
+        assert len(indices) == 100
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert np.all(np.diff(indices) > 0)
+
+    def test_short_series_unchanged(self):
+        x = np.arange(10, dtype=np.float64)
+        assert list(_lttb(x, x, 50)) == list(range(10))
+        assert list(_lttb(x, x, 2)) == list(range(10))
@@ -0,0 +1,111 @@
+"""
+Unit tests for copytrader_v2 security utilities.
+"""
+import base64
+
+import pytest
+
+from copytrader_v2.modules import security
+from copytrader_v2.modules.security import EncryptionManager, RateLimiter
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the rate limiter"""
+    now = [1000.0]
+    monkeypatch.setattr(security.time, 'monotonic', lambda: now[0])
+    return now
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    """EncryptionManager writing its logs (and any generated key) under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    return EncryptionManager()
+
+class TestHashing:
+    """Tests for PBKDF2 hashing"""
+
+    def test_hash_many_verifies(self, manager):
+        items = ['alpha', 'beta', 'gamma', 'alpha']
+        hashes = manager.hash_sensitive_data_many(items)
+        assert len(hashes) == len(items)
+        assert all(manager.verify_hash(item, hashed) for item, hashed in zip(items, hashes))
+        assert not manager.verify_hash('beta', hashes[0])
+        # Each value gets its own salt
+        assert hashes[0] != hashes[3]
+
+    def test_hash_many_small_inputs(self, manager):
+        assert manager.hash_sensitive_data_many([]) == []
+        [hashed] = manager.hash_sensitive_data_many(['only'])
+        assert manager.verify_hash('only', hashed)
+
+class TestEncryption:
+    """Tests for encrypt/decrypt"""
+
+    @pytest.fixture
+    def fernet_manager(self, monkeypatch, tmp_path):
+        fernet = pytest.importorskip('cryptography.fernet')
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv('COPYTRADER_ENCRYPTION_KEY', fernet.Fernet.generate_key().decode())
+        return EncryptionManager()
+
+    def test_round_trip(self, fernet_manager):
+        token = fernet_manager.encrypt('secret')
+        assert token.startswith('g')
+        assert fernet_manager.decrypt(token) == 'secret'
+
+    def test_decrypts_legacy_double_base64_token(self, fernet_manager):
+        token = fernet_manager._encryption_key.encrypt(b'secret')
+        legacy = base64.urlsafe_b64encode(token).decode()
+        assert legacy.startswith('Z')
+        assert fernet_manager.decrypt(legacy) == 'secret'
+
+    def test_invalid_token(self, fernet_manager):
+        with pytest.raises(security.EncryptionError):
+            fernet_manager.decrypt('not a token')
+
+    def test_passthrough_without_cryptography(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(security, 'CRYPTOGRAPHY_AVAILABLE', False)
+        manager = EncryptionManager()
+        assert manager.encrypt('secret') == 'secret'
+        assert manager.decrypt('secret') == 'secret'
+
+class TestRateLimiter:
+    """Tests for the token bucket"""
+
+    def test_allows_burst_then_blocks(self, clock):
+        limiter = RateLimiter()
+        assert all(limiter.is_allowed('user', max_requests=3) for _ in range(3))
+        assert not limiter.is_allowed('user', max_requests=3)
+        assert limiter.get_remaining_requests('user', max_requests=3) == 0
+
+    def test_refills_over_the_window(self, clock):
+        limiter = RateLimiter()
+        for _ in range(3):
+            limiter.is_allowed('user', max_requests=3)
+        clock[0] += 20  # A third of the one-minute window refills one token
+        assert limiter.get_remaining_requests('user', max_requests=3) == 1
+        assert limiter.is_allowed('user', max_requests=3)
+
+    def test_block_expires(self, clock):
+        limiter = RateLimiter()
+        for _ in range(2):
+            limiter.is_allowed('user', max_requests=1)
+        clock[0] += RateLimiter.BLOCK_MINUTES * 60 - 1
+        assert not limiter.is_allowed('user', max_requests=1)
+        clock[0] += 1
+        assert limiter.is_allowed('user', max_requests=1)
+
+    def test_remaining_does_not_take_a_token(self, clock):
+        limiter = RateLimiter()
+        limiter.is_allowed('user', max_requests=5)
+        for _ in range(3):
+            assert limiter.get_remaining_requests('user', max_requests=5) == 4
+        assert limiter.get_remaining_requests('other', max_requests=5) == 5
+
+    def test_reset_limits(self, clock):
+        limiter = RateLimiter()
+        for _ in range(2):
+            limiter.is_allowed('user', max_requests=1)
+        limiter.reset_limits('user')
+        assert limiter.is_allowed('user', max_requests=1)